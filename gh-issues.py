@@ -7,6 +7,7 @@ Specifically designed for GitHub Projects V2 using the GraphQL API.
 
 Requirements:
     pip install requests
+    pip install orjson  # optional, faster JSON decoding
 """
 
 import os
@@ -14,10 +15,22 @@ import sys
 import csv
 import html
 import re
+import json
+import time
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Faster JSON decoding of API responses when orjson is installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # ----------------------------------------------------------------------
 # Logging Setup
@@ -47,142 +60,243 @@ HEADERS = {
     "User-Agent": "gh-issues-to-csv",
 }
 
+COMMENT_BATCH_SIZE = 50  # Issues whose comments are requested per GraphQL query
+COMMENT_FETCH_WORKERS = 8  # Comment queries in flight at once
+PROGRESS_INTERVAL = 100  # Issues written between progress messages
+CSV_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+MAX_RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_WAIT_SECONDS = 60
+HTTP_POOL_SIZE = 20  # Keep-alive connections kept per host; above COMMENT_FETCH_WORKERS
+
+# One session for every request: connections stay open between pages and
+# batches, and responses are gzip-compressed. Transient 5xx responses are
+# retried by the adapter; GraphQL POSTs here are read-only, so retrying them is safe.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.headers["Accept-Encoding"] = "gzip"
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=HTTP_POOL_SIZE,
+    pool_maxsize=HTTP_POOL_SIZE,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                      allowed_methods=frozenset({"GET", "POST"}))
+))
+
 # ----------------------------------------------------------------------
 # GitHub API Helpers
 # ----------------------------------------------------------------------
-def gh_paginate(url: str, *, headers: dict, params: dict | None = None) -> List[Dict[str, Any]]:
-    """Fetch all items from a paginated GitHub REST API endpoint."""
-    items: List[Dict[str, Any]] = []
-    params = params or {}
-    
-    while url:
-        resp = requests.get(url, headers=headers, params=params)
-        resp.raise_for_status()
-        
-        batch = resp.json()
-        items.extend(batch if isinstance(batch, list) else batch.get("items", []))
-        
-        # Check for next page in Link header
-        link_header = resp.headers.get("Link", "")
-        url = None
-        for link in link_header.split(","):
-            if 'rel="next"' in link:
-                url = link[link.find("<") + 1 : link.find(">")]
-                break
-                
-    return items
+PROJECT_NUMBER = 2  # Organization ProjectV2 whose "Status" field is exported
 
-_project_status_cache = {}
+def _project_status(issue: Dict[str, Any]) -> str:
+    """Return the Status of a GraphQL issue node on PROJECT_NUMBER, or "" when it has none."""
+    for item in issue.get("projectItems", {}).get("nodes", []):
+        if item and (item.get("project") or {}).get("number") == PROJECT_NUMBER:
+            return (item.get("fieldValueByName") or {}).get("name") or ""
+    return ""
 
-def cache_all_project_statuses() -> None:
-    """Pre-fetch all project statuses to avoid individual API calls."""
-    try:
-        query = """
-        query($org: String!, $cursor: String) {
-          organization(login: $org) {
-            projectV2(number: 2) {
-              items(first: 100, after: $cursor) {
-                pageInfo {
-                  hasNextPage
-                  endCursor
+def iter_issue_pages_graphql(repo: str) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield the issues of a repository one page at a time, together with their project status.
+    
+    A single paginated GraphQL walk returns each issue's ProjectV2 "Status" with
+    it, so no separate pass over the project is needed. Pull requests are not
+    included. Issues are returned in the REST shape, with an added "project_column".
+    """
+    query = """
+    query($owner: String!, $name: String!, $cursor: String) {
+      repository(owner: $owner, name: $name) {
+        issues(first: 100, after: $cursor, orderBy: {field: CREATED_AT, direction: DESC}) {
+          pageInfo {
+            hasNextPage
+            endCursor
+          }
+          nodes {
+            number
+            title
+            state
+            createdAt
+            closedAt
+            labels(first: 100) {
+              nodes {
+                name
+              }
+            }
+            projectItems(first: 5) {
+              nodes {
+                project {
+                  number
                 }
-                nodes {
-                  content {
-                    ... on Issue {
-                      number
-                    }
-                  }
-                  fieldValues(first: 20) {
-                    nodes {
-                      ... on ProjectV2ItemFieldSingleSelectValue {
-                        name
-                        field {
-                          ... on ProjectV2SingleSelectField {
-                            name
-                          }
-                        }
-                      }
-                    }
+                fieldValueByName(name: "Status") {
+                  ... on ProjectV2ItemFieldSingleSelectValue {
+                    name
                   }
                 }
               }
             }
           }
         }
-        """
-        org = REPO.split('/')[0]
-        cursor = None
+      }
+    }
+    """
+    owner, name = repo.split("/")
+    graphql_headers = {**HEADERS, "Accept": "application/vnd.github.starfox-preview+json"}
+    cursor = None
+    
+    while True:
+        response = SESSION.post(
+            GRAPHQL_URL,
+            headers=graphql_headers,
+            json={"query": query, "variables": {"owner": owner, "name": name, "cursor": cursor}}
+        )
+        response.raise_for_status()
         
-        while True:
-            graphql_headers = {**HEADERS, "Accept": "application/vnd.github.starfox-preview+json"}
-            response = requests.post(
-                GRAPHQL_URL,
-                headers=graphql_headers,
-                json={"query": query, "variables": {"org": org, "cursor": cursor}}
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if "errors" in data:
-                    log.error(f"GraphQL errors while caching statuses: {data['errors']}")
-                    return
-                
-                project_data = data.get("data", {}).get("organization", {}).get("projectV2", {})
-                if project_data:
-                    items_data = project_data.get("items", {})
-                    
-                    for item in items_data.get("nodes", []):
-                        content = item.get("content", {})
-                        if not content:
-                            continue
-                            
-                        issue_number = content.get("number")
-                        if not issue_number:
-                            continue
-                            
-                        field_values = item.get("fieldValues", {}).get("nodes", [])
-                        status = "No status set"
-                        
-                        for value in field_values:
-                            if value and value.get("field", {}).get("name") == "Status":
-                                status = value.get("name")
-                                break
-                                
-                        _project_status_cache[issue_number] = status
-                    
-                    # Check for more pages
-                    page_info = items_data.get("pageInfo", {})
-                    if page_info.get("hasNextPage"):
-                        cursor = page_info.get("endCursor")
-                    else:
-                        break
-                        
-    except Exception as e:
-        log.error(f"Error caching project statuses: {str(e)}")
+        data = _loads(response.content)
+        if "errors" in data:
+            log.error("GraphQL errors while fetching issues: %s", data["errors"])
+            break
+        
+        issues_data = data.get("data", {}).get("repository", {}).get("issues", {})
+        yield [
+            {
+                "number": issue["number"],
+                "title": issue["title"],
+                "state": issue["state"].lower(),
+                "created_at": issue["createdAt"],
+                "closed_at": issue["closedAt"],
+                "labels": issue.get("labels", {}).get("nodes", []),
+                "project_column": _project_status(issue),
+            }
+            for issue in issues_data.get("nodes", [])
+        ]
+        
+        # Check for more pages
+        page_info = issues_data.get("pageInfo", {})
+        if not page_info.get("hasNextPage"):
+            break
+        cursor = page_info.get("endCursor")
+
+def fetch_issues_graphql(repo: str) -> List[Dict[str, Any]]:
+    """Fetch all issues of a repository with their project status. See iter_issue_pages_graphql."""
+    return [issue for page in iter_issue_pages_graphql(repo) for issue in page]
 
-def get_issue_project_column(issue_number: int) -> Optional[str]:
-    """Get the project column (status) for an issue from cache."""
-    return _project_status_cache.get(issue_number, None)
+def _comments_query(cursors: Dict[int, Optional[str]]) -> str:
+    """Build one GraphQL query fetching the next page of comments for several issues via aliases."""
+    selections = []
+    for number, cursor in cursors.items():
+        after = f', after: "{cursor}"' if cursor else ""
+        selections.append(f"i{number}: issue(number: {number}) {{ comments(first: 100{after}) {{ ...commentPage }} }}")
+    return """
+    query($owner: String!, $name: String!) {
+      repository(owner: $owner, name: $name) {
+        %s
+      }
+    }
+    fragment commentPage on IssueCommentConnection {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        author {
+          login
+        }
+        body
+      }
+    }
+    """ % "\n".join(selections)
+
+def _post_graphql(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """POST a GraphQL query, waiting and retrying up to MAX_RATE_LIMIT_RETRIES times when rate limited."""
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        response = SESSION.post(GRAPHQL_URL, json={"query": query, "variables": variables})
+        if response.status_code not in (403, 429) or attempt == MAX_RATE_LIMIT_RETRIES:
+            break
+        retry_after = response.headers.get("Retry-After", "")
+        wait = int(retry_after) if retry_after.isdigit() else RATE_LIMIT_WAIT_SECONDS
+        log.warning("Rate limited while fetching comments; retrying in %ds", wait)
+        time.sleep(wait)
+    response.raise_for_status()
+    return _loads(response.content)
 
-def get_issues(repo: str) -> List[Dict[str, Any]]:
-    """Fetch all issues from a repository."""
-    url = f"{GITHUB_API_URL}/repos/{repo}/issues"
-    return gh_paginate(url, headers=HEADERS, params={"state": "all", "per_page": 100})
+def _fetch_comment_batch(owner: str, name: str, cursors: Dict[int, Optional[str]]
+                         ) -> Tuple[Dict[int, List[Dict[str, Any]]], Dict[int, str]]:
+    """Fetch one page of comments for a batch of issues, returning the comments and the cursors left to follow."""
+    data = _post_graphql(_comments_query(cursors), {"owner": owner, "name": name})
+    if "errors" in data:
+        log.error("GraphQL errors while fetching comments: %s", data["errors"])
+    
+    comments: Dict[int, List[Dict[str, Any]]] = {}
+    next_cursors: Dict[int, str] = {}
+    repository = (data.get("data") or {}).get("repository") or {}
+    for alias, issue in repository.items():
+        if not issue:
+            continue
+        number = int(alias[1:])
+        page = issue["comments"]
+        comments[number] = [
+            {"user": {"login": (c.get("author") or {}).get("login", "ghost")}, "body": c["body"]}
+            for c in page["nodes"]
+        ]
+        if page["pageInfo"]["hasNextPage"]:
+            next_cursors[number] = page["pageInfo"]["endCursor"]
+    return comments, next_cursors
+
+def fetch_all_comments_graphql(repo: str, issue_numbers: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Fetch the comments of many issues with batched GraphQL queries.
+    
+    Each query covers COMMENT_BATCH_SIZE issues, and up to COMMENT_FETCH_WORKERS
+    queries are in flight at once. Issues with more than 100 comments are paged
+    with follow-up queries resuming from their cursors. Comments are returned in
+    the REST shape ({"user": {"login": ...}, "body": ...}), keyed by issue number.
+    """
+    owner, name = repo.split("/")
+    comments: Dict[int, List[Dict[str, Any]]] = {number: [] for number in issue_numbers}
+    pending: Dict[int, Optional[str]] = dict.fromkeys(issue_numbers)
+    
+    with ThreadPoolExecutor(max_workers=COMMENT_FETCH_WORKERS) as executor:
+        while pending:
+            numbers = list(pending)
+            batches = [
+                {number: pending[number] for number in numbers[start:start + COMMENT_BATCH_SIZE]}
+                for start in range(0, len(numbers), COMMENT_BATCH_SIZE)
+            ]
+            pending = {}
+            for batch_comments, next_cursors in executor.map(
+                lambda batch: _fetch_comment_batch(owner, name, batch), batches
+            ):
+                for number, page in batch_comments.items():
+                    comments[number].extend(page)
+                pending.update(next_cursors)
+    
+    return comments
 
-def get_comments(repo: str, issue_number: int) -> List[Dict[str, Any]]:
-    """Fetch all comments for an issue."""
-    url = f"{GITHUB_API_URL}/repos/{repo}/issues/{issue_number}/comments"
-    return gh_paginate(url, headers=HEADERS, params={"per_page": 100})
+# Text cleanup patterns used by sanitise_for_csv
+_WS_RE = re.compile(r"\s+")
+_TAG_RE = re.compile(r"<[^>]+>")
+_NEWLINE_TRANS = str.maketrans({"\r": " ", "\n": " "})
 
 def sanitise_for_csv(text: str) -> str:
     """Clean text for CSV output."""
     if not text:
         return ""
-    text = html.unescape(text)
-    text = text.replace("\r\n", " ").replace("\n", " ").replace("\r", " ")
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"<[^>]+>", "", text)
-    return text.strip()
+    text = html.unescape(text).translate(_NEWLINE_TRANS)
+    text = _TAG_RE.sub("", text)
+    return _WS_RE.sub(" ", text).strip()
+
+# CSV columns and how each is read from an issue, in output order.
+# GitHub timestamps are ISO 8601 ("YYYY-MM-DDTHH:MM:SSZ"), so the date is the first 10 chars.
+CSV_COLUMNS = [
+    ("Issue Number", lambda issue: issue["number"]),
+    ("Title", lambda issue: sanitise_for_csv(issue.get("title", ""))),
+    ("State", lambda issue: issue.get("state", "")),
+    ("Created Date", lambda issue: (issue.get("created_at") or "")[:10]),
+    ("Closed Date", lambda issue: (issue.get("closed_at") or "")[:10]),
+    ("Labels", lambda issue: ", ".join(lbl["name"] for lbl in issue.get("labels", []))),
+    ("Comments", lambda issue: sanitise_for_csv(
+        "\n".join(f"{c['user']['login']}: {c['body']}" for c in issue.get("comments_data", []))
+    )),
+    ("Project Column", lambda issue: issue["project_column"]),
+]
 
 # ----------------------------------------------------------------------
 # Main Script
@@ -195,80 +309,32 @@ def main() -> None:
     if os.path.exists(csv_path):
         os.remove(csv_path)
 
-    print("🔎  Fetching issues …")
-    issues = get_issues(REPO)
-    total_issues = len([i for i in issues if "pull_request" not in i])
-    
-    print("📊  Caching project statuses …")
-    cache_all_project_statuses()
-    
-    print(f"✨  Processing {total_issues} issues" + 
-          ("" if include_comments else " (skipping comments)") + 
+    print("🔎  Fetching and processing issues" +
+          ("" if include_comments else " (skipping comments)") +
           " …")
 
-    with open(csv_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(
-            csvfile,
-            fieldnames=[
-                "Issue Number", "Title", "State", "Created Date", "Closed Date",
-                "Labels", "Comments", "Project Column"
-            ],
-            quoting=csv.QUOTE_ALL,
-            escapechar="\\"
-        )
-        writer.writeheader()
+    with open(csv_path, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile, quoting=csv.QUOTE_ALL, escapechar="\\")
+        writer.writerow([name for name, _ in CSV_COLUMNS])
+        getters = [getter for _, getter in CSV_COLUMNS]
 
         processed = 0
-        for issue in issues:
-            if "pull_request" in issue:
-                continue
-
-            issue_number = issue["number"]
-            
-            # Get issue details
-            title = sanitise_for_csv(issue.get("title", ""))
-            state = issue.get("state", "")
-            
-            # Format dates (month day year)
-            created_date = ""
-            if created_at := issue.get("created_at"):
-                created_date = created_at.split("T")[0]
-                
-            closed_date = ""
-            if closed_at := issue.get("closed_at"):
-                closed_date = closed_at.split("T")[0]
-            
-            labels = ", ".join(lbl["name"] for lbl in issue.get("labels", []))
-            
-            # Get comments if enabled
-            comments_text = ""
+        # Each page is written as soon as it and its comments arrive, so only
+        # one page of issues is held in memory at a time
+        for issues in iter_issue_pages_graphql(REPO):
+            comments_by_issue: Dict[int, List[Dict[str, Any]]] = {}
             if include_comments:
-                comments = get_comments(REPO, issue_number)
-                comments_text = sanitise_for_csv(
-                    "\n".join(f"{c['user']['login']}: {c['body']}" for c in comments)
-                )
+                comments_by_issue = fetch_all_comments_graphql(REPO, [i["number"] for i in issues])
             
-            # Get project column from cache
-            column_name = get_issue_project_column(issue_number)
-            if column_name == "No status set":
-                column_name = ""
-
-            # Write to CSV
-            writer.writerow({
-                "Issue Number": issue_number,
-                "Title": title,
-                "State": state,
-                "Created Date": created_date,
-                "Closed Date": closed_date,
-                "Labels": labels,
-                "Comments": comments_text,
-                "Project Column": column_name
-            })
-            
-            processed += 1
-            print(f"✅  Processed issue #{issue_number} (total {processed})")
+            for issue in issues:
+                issue["comments_data"] = comments_by_issue.get(issue["number"], [])
+                writer.writerow([get(issue) for get in getters])
+                
+                processed += 1
+                if processed % PROGRESS_INTERVAL == 0:
+                    print(f"✅  Processed {processed} issues")
 
-    print(f"\n📊  Done! CSV written to {csv_path}")
+    print(f"\n📊  Done! {processed} issues written to {csv_path}")
 
 if __name__ == "__main__":
     main()
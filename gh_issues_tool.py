@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 """
-Export GitHub issues to CSV, Excel, or JSON, including comments, labels, and project status.
+Export GitHub issues to CSV, Excel, JSON, or JSON Lines, including comments, labels, and project status.
 Specifically designed for GitHub Projects V2 using the GraphQL API.
 
 Usages:
@@ -26,21 +26,30 @@ import json
 import logging
 import argparse
 import time
+import random
 import asyncio
+import dataclasses
+import hashlib
+import shelve
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union, Set, Tuple, Literal, TypedDict, cast
+from typing import (List, Dict, Any, Optional, Union, Set, Tuple, Literal, Callable, Iterable, Iterator,
+                    AsyncIterator, MutableMapping, Final, cast)
 from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qs, urlencode
 from enum import Enum
 from functools import wraps
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Optional imports - will be checked at runtime
 OPTIONAL_DEPS_AVAILABLE = False
 try:
     import httpx
-    import aiohttp
-    from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+    from tenacity import retry, stop_after_attempt, wait_random_exponential, retry_if_exception_type
     from tqdm import tqdm
     import pandas as pd
     from pydantic import BaseModel, Field, validator
@@ -48,6 +57,33 @@ try:
 except ImportError:
     pass
 
+# HTTP/2 for the async client needs the h2 package (installed by httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Streaming Excel writer; openpyxl (pandas' default) is used when it is missing
+try:
+    import xlsxwriter  # noqa: F401
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Faster JSON decoding of API responses and encoding of exports when orjson is installed
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        """Encode obj as compact UTF-8 JSON, serializing dataclasses like orjson does."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"),
+                          default=dataclasses.asdict).encode("utf-8")
+
 # ----------------------------------------------------------------------
 # Constants
 # ----------------------------------------------------------------------
@@ -56,6 +92,7 @@ class ExportFormat(str, Enum):
     CSV = "csv"
     EXCEL = "xlsx"
     JSON = "json"
+    JSONL = "jsonl"
 
 # Field names
 FIELD_STATUS = "Status"
@@ -73,6 +110,9 @@ FIELD_MILESTONE = "Milestone"
 FIELD_URL = "URL"
 FIELD_BODY = "Body"
 
+# Placeholder status for project items without a Status value
+NO_STATUS = "No status set"
+
 # Default field list for exports
 DEFAULT_FIELDS = [
     FIELD_ISSUE_NUMBER,
@@ -91,6 +131,14 @@ RETRY_BACKOFF_FACTOR = 2
 RATE_LIMIT_WAIT_SECONDS = 60
 BATCH_SIZE = 50
 CONCURRENT_REQUESTS = 5
+HTTP_POOL_SIZE = 16  # Pooled keep-alive connections for the shared sync session
+ETAG_CACHE_MAX_PAGES = 512  # Page bodies kept by the in-memory ETag cache
+PROJECT_NUMBER = 2  # Projects V2 board whose Status field fills the Project Column
+PROJECT_STATUS_BATCH_SIZE = 100
+
+# Export constants
+CSV_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+EXPORT_QUEUE_SIZE = 500  # Issues buffered between the fetcher and the file writer
 
 # ----------------------------------------------------------------------
 # Logging Setup
@@ -151,25 +199,108 @@ else:
             self.mentioned = mentioned
             self.milestone = milestone
 
-class Issue(TypedDict, total=False):
-    """Type definition for GitHub issue data."""
+@dataclasses.dataclass(slots=True)
+class IssueRec:
+    """
+    An exported GitHub issue, holding only the fields the exporters read.
+    
+    Slots keep the per-issue footprint small when a whole repository is held
+    in memory, and label names and logins are interned so each distinct value
+    is stored once. comments_data is None until the issue's comments have been fetched.
+    """
     number: int
     title: str
     state: str
     created_at: str
-    closed_at: Optional[str]
     updated_at: str
-    labels: List[Dict[str, str]]
-    comments_data: List[Dict[str, Any]]
-    project_column: Optional[str]
-    assignees: List[Dict[str, str]]
-    milestone: Optional[Dict[str, Any]]
     html_url: str
-    body: Optional[str]
+    closed_at: Optional[str] = None
+    body: Optional[str] = None
+    labels: List[Dict[str, str]] = dataclasses.field(default_factory=list)
+    assignees: List[Dict[str, str]] = dataclasses.field(default_factory=list)
+    milestone: Optional[Dict[str, Any]] = None
+    comments_data: Optional[List[Dict[str, Any]]] = None
+    project_column: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, issue: Dict[str, Any]) -> "IssueRec":
+        """Build a record from a REST API issue object."""
+        return cls(
+            number=issue["number"],
+            title=issue.get("title", ""),
+            state=issue.get("state", ""),
+            created_at=issue.get("created_at", ""),
+            updated_at=issue.get("updated_at", ""),
+            html_url=issue.get("html_url", ""),
+            closed_at=issue.get("closed_at"),
+            body=issue.get("body"),
+            labels=[{"name": sys.intern(label["name"])} for label in issue.get("labels", [])],
+            assignees=[{"login": sys.intern(assignee["login"])} for assignee in issue.get("assignees", [])],
+            milestone=issue.get("milestone"),
+            comments_data=issue.get("comments_data"),
+        )
 
 # ----------------------------------------------------------------------
 # GitHub API Helpers
 # ----------------------------------------------------------------------
+# Matches the URL of the rel="next" entry in a REST pagination Link header
+_LINK_NEXT_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+_LINK_LAST_RE = re.compile(r'<([^>]+)>;\s*rel="last"')
+
+def _next_page_url(link_header: str) -> str:
+    """Return the rel="next" URL of a Link header, or "" on the last page."""
+    match = _LINK_NEXT_RE.search(link_header)
+    return match.group(1) if match else ""
+
+def _remaining_page_urls(link_header: str) -> Optional[List[str]]:
+    """
+    Expand the rel="last" URL of a first-page Link header into the URLs of pages 2..last.
+    
+    Returns None when the endpoint does not advertise a numbered last page
+    (e.g. cursor-based pagination), in which case pages must be walked via rel="next".
+    """
+    match = _LINK_LAST_RE.search(link_header)
+    if not match:
+        return None
+    parts = urlsplit(match.group(1))
+    query = parse_qs(parts.query)
+    if not query.get("page", [""])[0].isdigit():
+        return None
+    urls = []
+    for page in range(2, int(query["page"][0]) + 1):
+        query["page"] = [str(page)]
+        urls.append(urlunsplit(parts._replace(query=urlencode(query, doseq=True))))
+    return urls
+
+class GHRateLimit(Exception):
+    """Raised when GitHub rejects a request because a rate limit was exceeded."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"GitHub rate limit exceeded; retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+def rate_limit_delay(status: int, headers: Any) -> Optional[float]:
+    """
+    Return the number of seconds to wait before retrying a rate-limited response.
+    
+    Honors Retry-After (secondary rate limits) and X-RateLimit-Reset (primary
+    rate limit). Returns None when the response is not rate limited.
+    """
+    if status not in (403, 429):
+        return None
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    if headers.get("X-RateLimit-Remaining") == "0":
+        reset_time = int(headers.get("X-RateLimit-Reset", "0"))
+        return max(0, reset_time - time.time()) + 1
+    if status == 429:
+        return float(RATE_LIMIT_WAIT_SECONDS)
+    return None
+
 def retry_decorator(max_retries=MAX_RETRIES, backoff_factor=RETRY_BACKOFF_FACTOR):
     """Simple retry decorator for when tenacity is not available."""
     def decorator(func):
@@ -179,354 +310,418 @@ def retry_decorator(max_retries=MAX_RETRIES, backoff_factor=RETRY_BACKOFF_FACTOR
             while retries <= max_retries:
                 try:
                     return func(*args, **kwargs)
-                except requests.exceptions.RequestException as e:
+                except (requests.exceptions.RequestException, GHRateLimit) as e:
                     retries += 1
                     if retries > max_retries:
                         raise
-                    wait_time = backoff_factor * (2 ** (retries - 1))
+                    response = getattr(e, "response", None)
+                    if isinstance(e, GHRateLimit):
+                        wait_time = e.retry_after
+                    elif response is not None and response.headers.get("Retry-After", "").isdigit():
+                        wait_time = float(response.headers["Retry-After"])
+                    else:
+                        # Full jitter keeps concurrent callers from retrying in lockstep
+                        wait_time = random.uniform(
+                            0, min(RATE_LIMIT_WAIT_SECONDS, backoff_factor * (2 ** (retries - 1)))
+                        )
                     log.warning(f"Request failed: {str(e)}. Retrying in {wait_time:.1f}s...")
                     time.sleep(wait_time)
         return wrapper
     return decorator
 
-# Define gh_paginate based on whether tenacity is available
+# Define the per-page retry policy based on whether tenacity is available
 if OPTIONAL_DEPS_AVAILABLE:
-    @retry(
+    _backoff_wait = wait_random_exponential(multiplier=RETRY_BACKOFF_FACTOR, max=RATE_LIMIT_WAIT_SECONDS)
+
+    def _wait_for_retry(retry_state) -> float:
+        """Wait for the server-provided delay on rate limits, jittered exponential backoff otherwise."""
+        exc = retry_state.outcome.exception()
+        if isinstance(exc, GHRateLimit):
+            log.warning(f"Rate limit exceeded. Waiting {exc.retry_after:.1f} seconds...")
+            return exc.retry_after
+        return _backoff_wait(retry_state)
+
+    _retry_page = retry(
         stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(multiplier=RETRY_BACKOFF_FACTOR),
-        retry=retry_if_exception_type((requests.exceptions.RequestException, httpx.HTTPError))
+        wait=_wait_for_retry,
+        retry=retry_if_exception_type((requests.exceptions.RequestException, httpx.HTTPError, GHRateLimit)),
+        reraise=True
+    )
+    _retry_page_async = retry(
+        stop=stop_after_attempt(MAX_RETRIES),
+        wait=_wait_for_retry,
+        retry=retry_if_exception_type((httpx.HTTPError, GHRateLimit)),
+        reraise=True
     )
-    def gh_paginate(url: str, *, headers: dict, params: dict | None = None) -> List[Dict[str, Any]]:
-        """Fetch all items from a paginated GitHub REST API endpoint with retry logic."""
-        items: List[Dict[str, Any]] = []
-        params = params or {}
-        
-        while url:
-            try:
-                resp = requests.get(url, headers=headers, params=params)
-                
-                # Check for rate limiting
-                if resp.status_code == 403 and 'X-RateLimit-Remaining' in resp.headers:
-                    remaining = int(resp.headers.get('X-RateLimit-Remaining', '1'))
-                    if remaining == 0:
-                        reset_time = int(resp.headers.get('X-RateLimit-Reset', '0'))
-                        sleep_time = max(0, reset_time - time.time()) + 1
-                        log.warning(f"Rate limit exceeded. Waiting {sleep_time:.1f} seconds...")
-                        time.sleep(sleep_time)
-                        continue
-                
-                resp.raise_for_status()
-                
-                batch = resp.json()
-                items.extend(batch if isinstance(batch, list) else batch.get("items", []))
-                
-                # Check for next page in Link header
-                link_header = resp.headers.get("Link", "")
-                next_url = None
-                for link in link_header.split(","):
-                    if 'rel="next"' in link:
-                        next_url = link[link.find("<") + 1 : link.find(">")]
-                        break
-                url = next_url or ""
-                    
-            except requests.exceptions.RequestException as e:
-                log.error(f"Error during API request: {str(e)}")
-                raise
-                
-        return items
 else:
-    @retry_decorator()
-    def gh_paginate(url: str, *, headers: dict, params: dict | None = None) -> List[Dict[str, Any]]:
-        """Fetch all items from a paginated GitHub REST API endpoint with retry logic."""
-        items: List[Dict[str, Any]] = []
-        params = params or {}
-        
-        while url:
+    _retry_page = retry_decorator()
+
+# Shared sync HTTP session so paginated and GraphQL requests reuse one pooled
+# keep-alive connection instead of paying a TCP+TLS handshake per request.
+# Sized for callers that share it across threads (e.g. the MCP batch tool); retries
+# stay in _retry_page so the adapter does not retry a second time underneath it.
+_SESSION_SYNC = requests.Session()
+_SESSION_SYNC.mount("https://", HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE))
+
+class _LRUCache(OrderedDict):
+    """Mapping that keeps at most maxsize entries, evicting the least recently used one."""
+    
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+# Page key -> (ETag, raw body, Link header) from the last full response. A 304 reply to a
+# conditional request is served from here and does not count against the rate limit.
+# In memory by default, bounded so a long-lived process does not keep every page it has
+# seen; persistent_etag_cache() swaps in an on-disk shelf.
+_etag_cache: MutableMapping[str, Tuple[str, bytes, str]] = _LRUCache(ETAG_CACHE_MAX_PAGES)
+ETAG_CACHE_FILENAME = "etag-cache"
+# Held for the whole persistent_etag_cache block: the shelf is swapped into the module
+# global above, so two overlapping blocks would restore each other's closed shelf.
+_etag_cache_lock = threading.Lock()
+
+def _etag_key(url: str, params: dict) -> str:
+    """Return the cache key for a page request: a digest of the URL and its sorted query parameters."""
+    query = "&".join(f"{k}={v}" for k, v in sorted(params.items())) if params else ""
+    return hashlib.sha1(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+@contextmanager
+def persistent_etag_cache(cache_dir: Optional[str]) -> Iterator[None]:
+    """
+    Keep the page ETag cache in a shelve file under cache_dir for the duration of the block.
+    
+    REST pages cached by an earlier run are revalidated with If-None-Match, so
+    unchanged ones come back as 304 responses. A falsy cache_dir leaves the
+    in-memory cache in place. Blocks from different threads run one at a time.
+    """
+    global _etag_cache
+    if not cache_dir:
+        yield
+        return
+    
+    os.makedirs(cache_dir, exist_ok=True)
+    with _etag_cache_lock:
+        previous = _etag_cache
+        with shelve.open(os.path.join(cache_dir, ETAG_CACHE_FILENAME)) as shelf:
+            _etag_cache = shelf
             try:
-                resp = requests.get(url, headers=headers, params=params)
-                
-                # Check for rate limiting
-                if resp.status_code == 403 and 'X-RateLimit-Remaining' in resp.headers:
-                    remaining = int(resp.headers.get('X-RateLimit-Remaining', '1'))
-                    if remaining == 0:
-                        reset_time = int(resp.headers.get('X-RateLimit-Reset', '0'))
-                        sleep_time = max(0, reset_time - time.time()) + 1
-                        log.warning(f"Rate limit exceeded. Waiting {sleep_time:.1f} seconds...")
-                        time.sleep(sleep_time)
-                        continue
-                
-                resp.raise_for_status()
-                
-                batch = resp.json()
-                items.extend(batch if isinstance(batch, list) else batch.get("items", []))
-                
-                # Check for next page in Link header
-                link_header = resp.headers.get("Link", "")
-                next_url = None
-                for link in link_header.split(","):
-                    if 'rel="next"' in link:
-                        next_url = link[link.find("<") + 1 : link.find(">")]
-                        break
-                url = next_url or ""
-                    
-            except requests.exceptions.RequestException as e:
-                log.error(f"Error during API request: {str(e)}")
-                raise
-                
-        return items
+                yield
+            finally:
+                _etag_cache = previous
+
+def _conditional_headers(headers: dict, cached: Optional[Tuple[str, bytes, str]]) -> dict:
+    """Return request headers carrying If-None-Match when the page has a cached entry."""
+    if cached is None:
+        return headers
+    return {**headers, "If-None-Match": cached[0]}
+
+def _cache_page(key: str, etag: Optional[str], body: bytes, link: str) -> None:
+    """Remember a page body under its ETag so the next export can revalidate it."""
+    if etag:
+        _etag_cache[key] = (etag, body, link)
+
+def _page_items(batch: Any) -> List[Dict[str, Any]]:
+    """Return the items of a decoded page: the list itself, or the "items" of a search result."""
+    return batch if isinstance(batch, list) else batch.get("items", [])
+
+def _read_page(key: str, resp: Any, cached: Optional[Tuple[str, bytes, str]]) -> Tuple[Any, str]:
+    """
+    Turn a page response into its decoded body and Link header.
+    
+    Shared by the sync and async fetchers: requests and httpx responses expose
+    the same status_code/headers/content/raise_for_status surface. Serves 304s
+    from cached, the ETag cache entry the request was made with (it may have been
+    evicted since), and raises GHRateLimit so the caller's retry policy waits.
+    """
+    if resp.status_code == 304 and cached is not None:
+        _, body, link = cached
+        return _loads(body), link
+    
+    delay = rate_limit_delay(resp.status_code, resp.headers)
+    if delay is not None:
+        raise GHRateLimit(delay)
+    resp.raise_for_status()
+    
+    link = resp.headers.get("Link", "")
+    _cache_page(key, resp.headers.get("ETag"), resp.content, link)
+    return _loads(resp.content), link
+
+@_retry_page
+def _fetch_page(url: str, *, headers: dict, params: Optional[dict]) -> Tuple[Any, str]:
+    """
+    Fetch one page of a REST listing, returning the decoded body and its Link header.
+    
+    params is None for URLs taken from a Link header, which already carry the full query.
+    """
+    key = _etag_key(url, params or {})
+    cached = _etag_cache.get(key)
+    return _read_page(key, _SESSION_SYNC.get(url, headers=_conditional_headers(headers, cached), params=params),
+                      cached)
+
+def gh_paginate(url: str, *, headers: dict, params: dict | None = None) -> List[Dict[str, Any]]:
+    """Fetch all items from a paginated GitHub REST API endpoint with retry logic."""
+    items: List[Dict[str, Any]] = []
+    params = params or {}
+    
+    while url:
+        try:
+            batch, link = _fetch_page(url, headers=headers, params=params)
+            url = _next_page_url(link)
+            # Later page URLs come from the Link header with the query already in them
+            params = None
+            items.extend(_page_items(batch))
+        except (requests.exceptions.RequestException, GHRateLimit) as e:
+            log.error(f"Error during API request: {str(e)}")
+            raise
+            
+    return items
+
+# Shared async HTTP state. The session and semaphore are bound to the event loop
+# they were created on, so they are (re)created lazily from inside the running loop.
+_SESSION: Optional["httpx.AsyncClient"] = None
+_SEM: Optional[asyncio.Semaphore] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+KEEPALIVE_TIMEOUT_SECONDS = 30
+REQUEST_TIMEOUT_SECONDS = 60
+
+def _bind_async_state() -> None:
+    """Reset the shared session and semaphore when first used from a new event loop."""
+    global _SESSION, _SEM, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SESSION_LOOP is not loop:
+        _SESSION = None
+        _SEM = asyncio.Semaphore(CONCURRENT_REQUESTS)
+        _SESSION_LOOP = loop
 
-# Async functions only available if aiohttp is installed
+def request_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore capping in-flight requests at CONCURRENT_REQUESTS."""
+    _bind_async_state()
+    return cast(asyncio.Semaphore, _SEM)
+
+# Async functions only available if httpx is installed
 if OPTIONAL_DEPS_AVAILABLE:
-    async def gh_paginate_async(url: str, *, headers: dict, params: dict | None = None, session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
+    async def get_session() -> httpx.AsyncClient:
+        """
+        Return the shared async HTTP client, creating it on first use.
+        
+        With HTTP/2 the concurrent requests are multiplexed over a single
+        connection to the API host; without h2 the client falls back to a
+        pool of HTTP/1.1 keep-alive connections.
+        """
+        global _SESSION
+        _bind_async_state()
+        if _SESSION is None or _SESSION.is_closed:
+            _SESSION = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=CONCURRENT_REQUESTS,
+                    keepalive_expiry=KEEPALIVE_TIMEOUT_SECONDS
+                ),
+                timeout=REQUEST_TIMEOUT_SECONDS
+            )
+        return _SESSION
+
+    async def close_session() -> None:
+        """Close the shared async HTTP client if one is open."""
+        global _SESSION
+        if _SESSION is not None and not _SESSION.is_closed:
+            await _SESSION.aclose()
+        _SESSION = None
+
+    @_retry_page_async
+    async def _fetch_page_async(url: str, *, headers: dict, params: Optional[dict],
+                                session: httpx.AsyncClient) -> Tuple[Any, str]:
+        """
+        Fetch one page of a REST listing asynchronously, returning the body and its Link header.
+        
+        params is None for URLs taken from a Link header. httpx replaces the URL's
+        query string whenever params is passed, even an empty dict, so it is only
+        passed when given.
+        """
+        key = _etag_key(url, params or {})
+        async with request_semaphore():
+            cached = _etag_cache.get(key)
+            request_headers = _conditional_headers(headers, cached)
+            if params is None:
+                resp = await session.get(url, headers=request_headers)
+            else:
+                resp = await session.get(url, headers=request_headers, params=params)
+        return _read_page(key, resp, cached)
+
+    async def gh_paginate_async(url: str, *, headers: dict, params: dict | None = None,
+                                session: Optional[httpx.AsyncClient] = None) -> List[Dict[str, Any]]:
         """Fetch all items from a paginated GitHub REST API endpoint asynchronously."""
         items: List[Dict[str, Any]] = []
         params = params or {}
+        session = session or await get_session()
         
-        while url:
-            try:
-                async with session.get(url, headers=headers, params=params) as resp:
-                    # Check for rate limiting
-                    if resp.status == 403 and 'X-RateLimit-Remaining' in resp.headers:
-                        remaining = int(resp.headers.get('X-RateLimit-Remaining', '1'))
-                        if remaining == 0:
-                            reset_time = int(resp.headers.get('X-RateLimit-Reset', '0'))
-                            sleep_time = max(0, reset_time - time.time()) + 1
-                            log.warning(f"Rate limit exceeded. Waiting {sleep_time:.1f} seconds...")
-                            await asyncio.sleep(sleep_time)
-                            continue
-                    
-                    resp.raise_for_status()
-                    batch = await resp.json()
-                    items.extend(batch if isinstance(batch, list) else batch.get("items", []))
-                    
-                    # Check for next page in Link header
-                    link_header = resp.headers.get("Link", "")
-                    next_url = None
-                    for link in link_header.split(","):
-                        if 'rel="next"' in link:
-                            next_url = link[link.find("<") + 1 : link.find(">")]
-                            break
-                    url = next_url or ""
-            except aiohttp.ClientError as e:
-                log.error(f"Error during async API request: {str(e)}")
-                raise
+        try:
+            batch, link = await _fetch_page_async(url, headers=headers, params=params, session=session)
+            items.extend(_page_items(batch))
+            
+            # When the first page advertises rel="last", request pages 2..last together.
+            # The page URLs already carry the query, and request_semaphore() bounds the fan-out.
+            page_urls = _remaining_page_urls(link)
+            if page_urls is not None:
+                pages = await asyncio.gather(*(
+                    _fetch_page_async(page_url, headers=headers, params=None, session=session)
+                    for page_url in page_urls
+                ))
+                for batch, _ in pages:
+                    items.extend(_page_items(batch))
+                return items
+            
+            url = _next_page_url(link)
+            while url:
+                batch, link = await _fetch_page_async(url, headers=headers, params=None, session=session)
+                items.extend(_page_items(batch))
+                url = _next_page_url(link)
+        except (httpx.HTTPError, GHRateLimit) as e:
+            log.error(f"Error during async API request: {str(e)}")
+            raise
                 
         return items
 
-_project_status_cache = {}
+# Aliased per-issue project status lookup; {selections} holds one "iN: issue(number: N)" per issue
+_PROJECT_STATUS_QUERY_TEMPLATE: Final[str] = """
+    query($owner: String!, $name: String!) {{
+      repository(owner: $owner, name: $name) {{
+        {selections}
+      }}
+    }}
+    fragment projectStatus on Issue {{
+      projectItems(first: 5) {{
+        nodes {{
+          project {{
+            number
+          }}
+          fieldValueByName(name: "%s") {{
+            ... on ProjectV2ItemFieldSingleSelectValue {{
+              name
+            }}
+          }}
+        }}
+      }}
+    }}
+    """ % FIELD_STATUS
+
+def _project_status_query(issue_numbers: List[int]) -> str:
+    """Build one GraphQL query that looks up the project items of several issues via aliases."""
+    selections = "\n".join(f"i{number}: issue(number: {number}) {{ ...projectStatus }}" for number in issue_numbers)
+    return _PROJECT_STATUS_QUERY_TEMPLATE.format(selections=selections)
+
+def _parse_project_statuses(data: Dict[str, Any]) -> Dict[int, str]:
+    """Extract {issue number: status} from a _project_status_query response."""
+    repository = (data.get("data") or {}).get("repository") or {}
+    statuses: Dict[int, str] = {}
+    for alias, issue in repository.items():
+        if not issue:
+            continue
+        status = NO_STATUS
+        for item in issue["projectItems"]["nodes"]:
+            if item and (item.get("project") or {}).get("number") == PROJECT_NUMBER:
+                value = item.get("fieldValueByName")
+                if value and value.get("name"):
+                    status = value["name"]
+                break
+        statuses[int(alias[1:])] = status
+    return statuses
+
+def _read_project_statuses(response: Any) -> Dict[int, str]:
+    """Return the statuses from a _project_status_query response (requests or httpx), or {} on failure."""
+    if response.status_code != 200:
+        log.error(f"Error fetching project statuses: {response.status_code}")
+        return {}
+    return _parse_project_statuses(_loads(response.content))
+
+def _apply_project_statuses(issues: Iterable[IssueRec], statuses: Dict[int, str]) -> None:
+    """Set each issue's project_column from {issue number: status}, as returned by fetch_project_statuses."""
+    for issue in issues:
+        issue.project_column = statuses.get(issue.number)
+
+def fetch_project_statuses(repo: str, issue_numbers: Iterable[int], *, graphql_url: str,
+                           headers: dict) -> Dict[int, str]:
+    """
+    Look up the project status of the given issues, PROJECT_STATUS_BATCH_SIZE issues per query.
+    
+    Every call queries the current statuses; nothing is kept between calls, so
+    a caller that fetches repeatedly sees issues move between columns.
+    """
+    owner, name = repo.split("/")
+    issue_numbers = list(dict.fromkeys(issue_numbers))
+    graphql_headers = {**headers, "Accept": "application/vnd.github.starfox-preview+json"}
+    statuses: Dict[int, str] = {}
+    
+    for start in range(0, len(issue_numbers), PROJECT_STATUS_BATCH_SIZE):
+        batch = issue_numbers[start:start + PROJECT_STATUS_BATCH_SIZE]
+        try:
+            statuses.update(_read_project_statuses(_SESSION_SYNC.post(
+                graphql_url,
+                headers=graphql_headers,
+                json={"query": _project_status_query(batch), "variables": {"owner": owner, "name": name}}
+            )))
+        except Exception as e:
+            log.error(f"Error fetching project statuses: {str(e)}")
+    
+    return statuses
 
-# Define cache_all_project_statuses based on whether aiohttp is available
 if OPTIONAL_DEPS_AVAILABLE:
-    async def cache_all_project_statuses_async(graphql_url: str, *, headers: dict, org: str, session: aiohttp.ClientSession) -> None:
-        """Pre-fetch all project statuses to avoid individual API calls."""
+    async def _fetch_project_status_batch(batch: List[int], *, owner: str, name: str, graphql_url: str,
+                                          headers: dict, session: httpx.AsyncClient) -> Dict[int, str]:
+        """Fetch the project statuses of one batch of issues, or {} on failure."""
         try:
-            query = """
-            query($org: String!, $cursor: String) {
-              organization(login: $org) {
-                projectV2(number: 2) {
-                  items(first: 100, after: $cursor) {
-                    pageInfo {
-                      hasNextPage
-                      endCursor
-                    }
-                    nodes {
-                      content {
-                        ... on Issue {
-                          number
-                        }
-                      }
-                      fieldValues(first: 20) {
-                        nodes {
-                          ... on ProjectV2ItemFieldSingleSelectValue {
-                            name
-                            field {
-                              ... on ProjectV2SingleSelectField {
-                                name
-                              }
-                            }
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-            """
-            # org taken from arguments
-            cursor = None
-            
-            while True:
-                graphql_headers = {**headers, "Accept": "application/vnd.github.starfox-preview+json"}
-                async with session.post(
+            async with request_semaphore():
+                response = await session.post(
                     graphql_url,
-                    headers=graphql_headers,
-                    json={"query": query, "variables": {"org": org, "cursor": cursor}}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if "errors" in data:
-                            log.error(f"GraphQL errors while caching statuses: {data['errors']}")
-                            return
-                        
-                        project_data = data.get("data", {}).get("organization", {}).get("projectV2", {})
-                        if project_data:
-                            items_data = project_data.get("items", {})
-                            
-                            for item in items_data.get("nodes", []):
-                                content = item.get("content", {})
-                                if not content:
-                                    continue
-                                    
-                                issue_number = content.get("number")
-                                if not issue_number:
-                                    continue
-                                    
-                                field_values = item.get("fieldValues", {}).get("nodes", [])
-                                status = "No status set"
-                                
-                                for value in field_values:
-                                    if value and value.get("field", {}).get("name") == FIELD_STATUS:
-                                        status = value.get("name")
-                                        break
-                                        
-                                _project_status_cache[issue_number] = status
-                            
-                            # Check for more pages
-                            page_info = items_data.get("pageInfo", {})
-                            if page_info.get("hasNextPage"):
-                                cursor = page_info.get("endCursor")
-                            else:
-                                break
-                    else:
-                        log.error(f"Error fetching project statuses: {response.status}")
-                        break
-                        
+                    headers=headers,
+                    json={"query": _project_status_query(batch), "variables": {"owner": owner, "name": name}}
+                )
+            return _read_project_statuses(response)
         except Exception as e:
-            log.error(f"Error caching project statuses: {str(e)}")
+            log.error(f"Error fetching project statuses: {str(e)}")
+            return {}
 
-def cache_all_project_statuses(graphql_url: str, *, headers: dict, org: str) -> None:
-    """Pre-fetch all project statuses to avoid individual API calls."""
-    try:
-        query = """
-        query($org: String!, $cursor: String) {
-          organization(login: $org) {
-            projectV2(number: 2) {
-              items(first: 100, after: $cursor) {
-                pageInfo {
-                  hasNextPage
-                  endCursor
-                }
-                nodes {
-                  content {
-                    ... on Issue {
-                      number
-                    }
-                  }
-                  fieldValues(first: 20) {
-                    nodes {
-                      ... on ProjectV2ItemFieldSingleSelectValue {
-                        name
-                        field {
-                          ... on ProjectV2SingleSelectField {
-                            name
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
-        # org taken from arguments
-        cursor = None
+    async def fetch_project_statuses_async(repo: str, issue_numbers: Iterable[int], *, graphql_url: str,
+                                           headers: dict,
+                                           session: Optional[httpx.AsyncClient] = None) -> Dict[int, str]:
+        """Asynchronous variant of fetch_project_statuses; batches are requested concurrently."""
+        owner, name = repo.split("/")
+        session = session or await get_session()
+        issue_numbers = list(dict.fromkeys(issue_numbers))
+        graphql_headers = {**headers, "Accept": "application/vnd.github.starfox-preview+json"}
         
-        while True:
-            graphql_headers = {**headers, "Accept": "application/vnd.github.starfox-preview+json"}
-            response = requests.post(
-                graphql_url,
-                headers=graphql_headers,
-                json={"query": query, "variables": {"org": org, "cursor": cursor}}
+        batches = await asyncio.gather(*(
+            _fetch_project_status_batch(
+                issue_numbers[start:start + PROJECT_STATUS_BATCH_SIZE],
+                owner=owner, name=name, graphql_url=graphql_url, headers=graphql_headers, session=session
             )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if "errors" in data:
-                    log.error(f"GraphQL errors while caching statuses: {data['errors']}")
-                    return
-                
-                project_data = data.get("data", {}).get("organization", {}).get("projectV2", {})
-                if project_data:
-                    items_data = project_data.get("items", {})
-                    
-                    for item in items_data.get("nodes", []):
-                        content = item.get("content", {})
-                        if not content:
-                            continue
-                            
-                        issue_number = content.get("number")
-                        if not issue_number:
-                            continue
-                            
-                        field_values = item.get("fieldValues", {}).get("nodes", [])
-                        status = "No status set"
-                        
-                        for value in field_values:
-                            if value and value.get("field", {}).get("name") == FIELD_STATUS:
-                                status = value.get("name")
-                                break
-                                
-                        _project_status_cache[issue_number] = status
-                    
-                    # Check for more pages
-                    page_info = items_data.get("pageInfo", {})
-                    if page_info.get("hasNextPage"):
-                        cursor = page_info.get("endCursor")
-                    else:
-                        break
-            else:
-                log.error(f"Error fetching project statuses: {response.status_code}")
-                break
-                
-    except Exception as e:
-        log.error(f"Error caching project statuses: {str(e)}")
-
-def get_issue_project_column(issue_number: int) -> Optional[str]:
-    """Get the project column (status) for an issue from cache."""
-    return _project_status_cache.get(issue_number, None)
-
-# GraphQL issues query only available if aiohttp is installed
-if OPTIONAL_DEPS_AVAILABLE:
-    async def get_issues_graphql(repo: str, *, graphql_url: str, headers: dict, session: aiohttp.ClientSession, 
-                                filter_params: Optional[IssueFilter] = None) -> List[Dict[str, Any]]:
-        """Fetch issues using GraphQL API for better efficiency."""
-        org, repo_name = repo.split("/")
-        issues = []
-        cursor = None
-        
-        # Build filter conditions
-        filter_conditions = []
-        if filter_params:
-            if filter_params.state and filter_params.state != "all":
-                filter_conditions.append(f"states: {filter_params.state.upper()}")
-            if filter_params.labels:
-                labels_str = ", ".join([f'"{label}"' for label in filter_params.labels])
-                filter_conditions.append(f"labels: [{labels_str}]")
-            if filter_params.since:
-                since_str = filter_params.since.isoformat()
-                filter_conditions.append(f'filterBy: {{since: "{since_str}"}}')
-        
-        filter_string = ", ".join(filter_conditions)
-        if filter_string:
-            filter_string = f"({filter_string})"
+            for start in range(0, len(issue_numbers), PROJECT_STATUS_BATCH_SIZE)
+        ))
         
-        query = f"""
+        statuses: Dict[int, str] = {}
+        for batch_statuses in batches:
+            statuses.update(batch_statuses)
+        return statuses
+
+# Paginated issues query; {filter_string} holds the optional ", states: ..., labels: ..." arguments
+_ISSUES_QUERY_TEMPLATE: Final[str] = """
         query($owner: String!, $name: String!, $cursor: String) {{
           repository(owner: $owner, name: $name) {{
-            issues{filter_string} (first: 100, after: $cursor, orderBy: {{field: CREATED_AT, direction: DESC}}) {{
+            issues(first: 100, after: $cursor, orderBy: {{field: CREATED_AT, direction: DESC}}{filter_string}) {{
               pageInfo {{
                 hasNextPage
                 endCursor
@@ -552,23 +747,79 @@ if OPTIONAL_DEPS_AVAILABLE:
                 }}
                 milestone {{
                   title
-                }}
+                }}{comments_selection}
               }}
             }}
           }}
         }}
         """
+
+# Inline first page of comments, substituted into {comments_selection} when comments are exported
+_ISSUE_COMMENTS_SELECTION: Final[str] = """
+                comments(first: 100) {
+                  pageInfo {
+                    hasNextPage
+                    endCursor
+                  }
+                  nodes {
+                    author {
+                      login
+                    }
+                    body
+                    createdAt
+                  }
+                }"""
+
+# GraphQL issues query only available if httpx is installed
+if OPTIONAL_DEPS_AVAILABLE:
+    async def iter_issue_pages_graphql(repo: str, *, graphql_url: str, headers: dict,
+                                       session: Optional[httpx.AsyncClient] = None,
+                                       filter_params: Optional[IssueFilter] = None,
+                                       include_comments: bool = True) -> AsyncIterator[List[IssueRec]]:
+        """
+        Fetch issues using GraphQL API for better efficiency, yielding one page at a time.
+        
+        When include_comments is set, the first 100 comments of every issue are
+        requested inline so no per-issue REST call is needed. Issues with more
+        comments than that are returned with comments_data=None; process_issues_batch
+        fetches the full list for those via REST.
+        """
+        org, repo_name = repo.split("/")
+        session = session or await get_session()
+        cursor = None
+        
+        # Build filter conditions
+        filter_conditions = []
+        if filter_params:
+            if filter_params.state and filter_params.state != "all":
+                filter_conditions.append(f"states: {filter_params.state.upper()}")
+            if filter_params.labels:
+                labels_str = ", ".join([f'"{label}"' for label in filter_params.labels])
+                filter_conditions.append(f"labels: [{labels_str}]")
+            if filter_params.since:
+                since_str = filter_params.since.isoformat()
+                filter_conditions.append(f'filterBy: {{since: "{since_str}"}}')
+        
+        filter_string = "".join(f", {condition}" for condition in filter_conditions)
         
+        query = _ISSUES_QUERY_TEMPLATE.format(
+            filter_string=filter_string,
+            comments_selection=_ISSUE_COMMENTS_SELECTION if include_comments else ""
+        )
+        
+        has_next_page = True
         try:
-            while True:
+            while has_next_page:
+                page: List[IssueRec] = []
                 graphql_headers = {**headers, "Accept": "application/vnd.github.starfox-preview+json"}
-                async with session.post(
-                    graphql_url,
-                    headers=graphql_headers,
-                    json={"query": query, "variables": {"owner": org, "name": repo_name, "cursor": cursor}}
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
+                async with request_semaphore():
+                    response = await session.post(
+                        graphql_url,
+                        headers=graphql_headers,
+                        json={"query": query, "variables": {"owner": org, "name": repo_name, "cursor": cursor}}
+                    )
+                    if response.status_code == 200:
+                        data = _loads(response.content)
                         if "errors" in data:
                             log.error(f"GraphQL errors while fetching issues: {data['errors']}")
                             break
@@ -576,52 +827,96 @@ if OPTIONAL_DEPS_AVAILABLE:
                         issues_data = data.get("data", {}).get("repository", {}).get("issues", {})
                         
                         for issue in issues_data.get("nodes", []):
-                            # Convert GraphQL format to REST API format for consistency
-                            formatted_issue = {
-                                "number": issue["number"],
-                                "title": issue["title"],
-                                "state": issue["state"].lower(),
-                                "created_at": issue["createdAt"],
-                                "closed_at": issue["closedAt"],
-                                "updated_at": issue["updatedAt"],
-                                "html_url": issue["url"],
-                                "body": issue["bodyText"],
-                                "labels": [{"name": label["name"]} for label in issue.get("labels", {}).get("nodes", [])],
-                                "assignees": [{"login": assignee["login"]} for assignee in issue.get("assignees", {}).get("nodes", [])],
-                            }
+                            # Convert GraphQL format to REST API shapes for consistency
+                            formatted_issue = IssueRec(
+                                number=issue["number"],
+                                title=issue["title"],
+                                state=issue["state"].lower(),
+                                created_at=issue["createdAt"],
+                                closed_at=issue["closedAt"],
+                                updated_at=issue["updatedAt"],
+                                html_url=issue["url"],
+                                body=issue["bodyText"],
+                                labels=[{"name": sys.intern(label["name"])}
+                                        for label in issue.get("labels", {}).get("nodes", [])],
+                                assignees=[{"login": sys.intern(assignee["login"])}
+                                           for assignee in issue.get("assignees", {}).get("nodes", [])],
+                            )
                             
                             if issue.get("milestone"):
-                                formatted_issue["milestone"] = {"title": issue["milestone"]["title"]}
+                                formatted_issue.milestone = {"title": issue["milestone"]["title"]}
+                            
+                            if not include_comments:
+                                formatted_issue.comments_data = []
+                            else:
+                                comments = issue.get("comments") or {}
+                                # Leave comments_data unset for issues with more than one page
+                                # of comments so the caller fetches the complete list
+                                if not comments.get("pageInfo", {}).get("hasNextPage"):
+                                    formatted_issue.comments_data = [
+                                        {
+                                            "user": {"login": sys.intern((comment.get("author") or {}).get("login", "ghost"))},
+                                            "body": comment["body"],
+                                            "created_at": comment["createdAt"],
+                                        }
+                                        for comment in comments.get("nodes", [])
+                                    ]
                             
-                            issues.append(formatted_issue)
+                            page.append(formatted_issue)
                         
                         # Check for more pages
                         page_info = issues_data.get("pageInfo", {})
-                        if page_info.get("hasNextPage"):
-                            cursor = page_info.get("endCursor")
-                        else:
-                            break
+                        has_next_page = bool(page_info.get("hasNextPage"))
+                        cursor = page_info.get("endCursor")
                     else:
-                        log.error(f"Error fetching issues via GraphQL: {response.status}")
+                        log.error(f"Error fetching issues via GraphQL: {response.status_code}")
                         break
+                
+                # Yield outside the semaphore so the slot is released while the consumer works
+                yield page
         except Exception as e:
             log.error(f"Error in GraphQL issues query: {str(e)}")
-        
+
+    async def get_issues_graphql(repo: str, *, graphql_url: str, headers: dict,
+                                session: Optional[httpx.AsyncClient] = None,
+                                filter_params: Optional[IssueFilter] = None,
+                                include_comments: bool = True) -> List[IssueRec]:
+        """Fetch all issues using GraphQL API. See iter_issue_pages_graphql."""
+        issues: List[IssueRec] = []
+        async for page in iter_issue_pages_graphql(
+            repo, graphql_url=graphql_url, headers=headers, session=session,
+            filter_params=filter_params, include_comments=include_comments
+        ):
+            issues.extend(page)
         return issues
 
-def get_issues(repo: str, *, api_url: str, headers: dict) -> List[Dict[str, Any]]:
-    """Fetch all issues from a repository."""
+def get_issues(repo: str, *, api_url: str, headers: dict,
+               filter_params: Optional[IssueFilter] = None) -> List[Dict[str, Any]]:
+    """Fetch all issues from a repository, excluding the pull requests the REST endpoint also returns."""
     url = f"{api_url}/repos/{repo}/issues"
-    return gh_paginate(url, headers=headers, params={"state": "all", "per_page": 100})
+    params: Dict[str, Any] = {"state": "all", "per_page": 100}
+    if filter_params:
+        if filter_params.state:
+            params["state"] = filter_params.state
+        if filter_params.labels:
+            params["labels"] = ",".join(filter_params.labels)
+        if filter_params.since:
+            since = filter_params.since
+            params["since"] = since.isoformat() if isinstance(since, datetime) else since
+        for name in ("assignee", "creator", "mentioned", "milestone"):
+            if getattr(filter_params, name):
+                params[name] = getattr(filter_params, name)
+    return [issue for issue in gh_paginate(url, headers=headers, params=params) if "pull_request" not in issue]
 
 def get_comments(repo: str, issue_number: int, *, api_url: str, headers: dict) -> List[Dict[str, Any]]:
     """Fetch all comments for an issue."""
     url = f"{api_url}/repos/{repo}/issues/{issue_number}/comments"
     return gh_paginate(url, headers=headers, params={"per_page": 100})
 
-# Async comments fetching only available if aiohttp is installed
+# Async comments fetching only available if httpx is installed
 if OPTIONAL_DEPS_AVAILABLE:
-    async def get_comments_async(repo: str, issue_number: int, *, api_url: str, headers: dict, session: aiohttp.ClientSession) -> List[Dict[str, Any]]:
+    async def get_comments_async(repo: str, issue_number: int, *, api_url: str, headers: dict,
+                                 session: Optional[httpx.AsyncClient] = None) -> List[Dict[str, Any]]:
         """Fetch all comments for an issue asynchronously."""
         url = f"{api_url}/repos/{repo}/issues/{issue_number}/comments"
         try:
@@ -630,57 +925,100 @@ if OPTIONAL_DEPS_AVAILABLE:
             log.warning(f"Failed to fetch comments for issue #{issue_number}: {str(e)}")
             return []
 
-    async def process_issues_batch(issues: List[Dict[str, Any]], repo: str, *, api_url: str, headers: dict, 
-                                include_comments: bool) -> List[Issue]:
-        """Process a batch of issues concurrently."""
-        processed_issues: List[Issue] = []
+    async def fetch_all_comments_async(repo: str, issue_numbers: Iterable[int], *, api_url: str, headers: dict,
+                                       session: Optional[httpx.AsyncClient] = None) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Fetch the comments of many issues concurrently over the shared client.
         
-        async with aiohttp.ClientSession() as session:
-            if include_comments:
-                # Fetch comments for all issues in the batch concurrently
-                tasks = []
-                for issue in issues:
-                    if "pull_request" not in issue:
-                        task = get_comments_async(repo, issue["number"], api_url=api_url, headers=headers, session=session)
-                        tasks.append((issue, task))
-                
-                # Process results as they complete
-                for issue, task in tasks:
-                    try:
-                        comments = await task
-                        issue_data = cast(Issue, issue)
-                        issue_data["comments_data"] = comments
-                        processed_issues.append(issue_data)
-                    except Exception as e:
-                        log.error(f"Error processing issue #{issue['number']}: {str(e)}")
-            else:
-                # No comments needed, just process the issues
-                for issue in issues:
-                    if "pull_request" not in issue:
-                        issue_data = cast(Issue, issue)
-                        issue_data["comments_data"] = []
-                        processed_issues.append(issue_data)
+        In-flight requests are capped by request_semaphore(), and rate-limited
+        pages are waited out by the per-page retry policy. Issues whose comments
+        could not be fetched map to an empty list.
+        """
+        session = session or await get_session()
+        numbers = list(dict.fromkeys(issue_numbers))
+        results = await asyncio.gather(
+            *(get_comments_async(repo, number, api_url=api_url, headers=headers, session=session)
+              for number in numbers),
+            return_exceptions=True
+        )
+        comments: Dict[int, List[Dict[str, Any]]] = {}
+        for number, result in zip(numbers, results):
+            if isinstance(result, BaseException):
+                log.error(f"Error fetching comments for issue #{number}: {str(result)}")
+                result = []
+            comments[number] = result
+        return comments
+
+    def fetch_all_comments(repo: str, issue_numbers: Iterable[int], *, api_url: str,
+                           headers: dict) -> Dict[int, List[Dict[str, Any]]]:
+        """Synchronous entry point for fetch_all_comments_async, for callers outside an event loop."""
+        async def _run() -> Dict[int, List[Dict[str, Any]]]:
+            try:
+                return await fetch_all_comments_async(repo, issue_numbers, api_url=api_url, headers=headers)
+            finally:
+                await close_session()
+        return asyncio.run(_run())
+
+    async def process_issues_batch(issues: List[Union[IssueRec, Dict[str, Any]]], repo: str, *, api_url: str,
+                                   headers: dict, include_comments: bool) -> List[IssueRec]:
+        """
+        Attach comments to a batch of issues, skipping pull requests.
+        
+        REST issue objects are converted to IssueRec. Records that already carry
+        comments (e.g. from get_issues_graphql) are passed through untouched; only
+        the remainder are fetched concurrently via REST.
+        """
+        processed_issues: List[IssueRec] = []
+        pending: List[IssueRec] = []
+        
+        for issue in issues:
+            if isinstance(issue, dict):
+                if "pull_request" in issue:
+                    continue
+                issue = IssueRec.from_dict(issue)
+            if not include_comments:
+                issue.comments_data = []
+            elif issue.comments_data is None:
+                pending.append(issue)
+            processed_issues.append(issue)
+        
+        if pending:
+            comments = await fetch_all_comments_async(
+                repo, [issue.number for issue in pending], api_url=api_url, headers=headers
+            )
+            for issue in pending:
+                issue.comments_data = comments[issue.number]
         
         return processed_issues
 
+# Text cleanup patterns used by sanitise_for_csv
+_WS_RE = re.compile(r"\s+")
+_TAG_RE = re.compile(r"<[^>]+>")
+_NEWLINE_TABLE = str.maketrans({"\r": " ", "\n": " "})
+
 def sanitise_for_csv(text: str) -> str:
     """Clean text for CSV output."""
     if not text:
         return ""
-    text = html.unescape(text)
-    text = text.replace("\r\n", " ").replace("\n", " ").replace("\r", " ")
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"<[^>]+>", "", text)
-    return text.strip()
+    if "&" in text:
+        text = html.unescape(text)
+    text = text.translate(_NEWLINE_TABLE)
+    if "<" in text:
+        text = _TAG_RE.sub("", text)
+    return _WS_RE.sub(" ", text).strip()
+
+# Input validation patterns
+_REPO_RE = re.compile(r'[A-Za-z0-9_.\-]+/[A-Za-z0-9_.\-]+')
+_TOKEN_RE = re.compile(r'[A-Za-z0-9_\-]{40,}')
 
 def validate_repo_format(repo: str) -> bool:
     """Validate repository format (org/repo)."""
-    return bool(re.match(r'^[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+$', repo))
+    return bool(_REPO_RE.fullmatch(repo))
 
 def validate_token(token: str) -> bool:
     """Basic validation for GitHub token format."""
     # Most tokens are at least 40 chars and alphanumeric
-    return bool(token and len(token) >= 40 and re.match(r'^[a-zA-Z0-9_-]+$', token))
+    return bool(token) and len(token) >= 40 and bool(_TOKEN_RE.fullmatch(token))
 
 def get_export_format(output_path: str) -> ExportFormat:
     """Determine export format from file extension."""
@@ -689,90 +1027,395 @@ def get_export_format(output_path: str) -> ExportFormat:
         return ExportFormat.EXCEL
     elif ext == '.json':
         return ExportFormat.JSON
+    elif ext == '.jsonl':
+        return ExportFormat.JSONL
     else:
         return ExportFormat.CSV
 
 # ----------------------------------------------------------------------
 # Export functions
 # ----------------------------------------------------------------------
-def export_to_csv(issues: List[Issue], output_path: str, fields: List[str]) -> None:
+def _project_column(issue: IssueRec) -> str:
+    """Return the project column for an issue, or an empty string if it has none."""
+    column_name = issue.project_column
+    return "" if column_name in (None, NO_STATUS) else column_name
+
+# Per-field value extractors, looked up once per export rather than once per row.
+# GitHub timestamps are fixed-width ISO 8601 ("YYYY-MM-DDTHH:MM:SSZ"), so the date is the first 10 chars.
+_FIELD_EXTRACTORS: Dict[str, Callable[[IssueRec], Any]] = {
+    FIELD_ISSUE_NUMBER: lambda issue: issue.number,
+    FIELD_TITLE: lambda issue: sanitise_for_csv(issue.title),
+    FIELD_STATE: lambda issue: issue.state,
+    FIELD_CREATED_DATE: lambda issue: (issue.created_at or "")[:10],
+    FIELD_CLOSED_DATE: lambda issue: (issue.closed_at or "")[:10],
+    FIELD_UPDATED_DATE: lambda issue: (issue.updated_at or "")[:10],
+    FIELD_LABELS: lambda issue: ", ".join(lbl["name"] for lbl in issue.labels),
+    FIELD_COMMENTS: lambda issue: sanitise_for_csv(
+        "\n".join(f"{c['user']['login']}: {c['body']}" for c in issue.comments_data or [])
+    ),
+    FIELD_PROJECT_COLUMN: _project_column,
+    FIELD_ASSIGNEES: lambda issue: ", ".join(a["login"] for a in issue.assignees),
+    FIELD_MILESTONE: lambda issue: issue.milestone["title"] if issue.milestone else "",
+    FIELD_URL: lambda issue: issue.html_url,
+    FIELD_BODY: lambda issue: sanitise_for_csv(issue.body or ""),
+}
+
+def _empty_cell(issue: IssueRec) -> str:
+    """Extractor for unknown field names: always an empty cell."""
+    return ""
+
+def _row_extractors(fields: List[str]) -> List[Callable[[IssueRec], Any]]:
+    """Resolve the extractor for each requested field, in output order."""
+    unknown = [field for field in fields if field not in _FIELD_EXTRACTORS]
+    if unknown:
+        log.warning(f"Unknown export fields will be left empty: {', '.join(unknown)}")
+    return [_FIELD_EXTRACTORS.get(field, _empty_cell) for field in fields]
+
+def _iter_rows(issues: Iterable[IssueRec], fields: List[str]) -> Iterable[List[Any]]:
+    """Yield one list of cell values per issue, ordered like fields."""
+    extractors = _row_extractors(fields)
+    for issue in issues:
+        yield [extract(issue) for extract in extractors]
+
+def export_to_csv(issues: Iterable[IssueRec], output_path: str, fields: List[str]) -> None:
     """Export issues to CSV format."""
-    with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(
-            csvfile,
-            fieldnames=fields,
-            quoting=csv.QUOTE_ALL,
-            escapechar="\\"
-        )
-        writer.writeheader()
-        
-        for issue in issues:
-            row: Dict[str, str] = {field: "" for field in fields}
-            
-            if FIELD_ISSUE_NUMBER in fields and "number" in issue:
-                row[FIELD_ISSUE_NUMBER] = str(issue["number"])
-            
-            if FIELD_TITLE in fields:
-                row[FIELD_TITLE] = sanitise_for_csv(issue.get("title", ""))
-            
-            if FIELD_STATE in fields:
-                row[FIELD_STATE] = issue.get("state", "")
-            
-            if FIELD_CREATED_DATE in fields and "created_at" in issue:
-                row[FIELD_CREATED_DATE] = issue["created_at"].split("T")[0] if issue["created_at"] else ""
-            
-            if FIELD_CLOSED_DATE in fields and "closed_at" in issue:
-                row[FIELD_CLOSED_DATE] = issue["closed_at"].split("T")[0] if issue["closed_at"] else ""
-                
-            if FIELD_UPDATED_DATE in fields and "updated_at" in issue:
-                row[FIELD_UPDATED_DATE] = issue["updated_at"].split("T")[0] if issue["updated_at"] else ""
-            
-            if FIELD_LABELS in fields:
-                row[FIELD_LABELS] = ", ".join(lbl["name"] for lbl in issue.get("labels", []))
-            
-            if FIELD_COMMENTS in fields and "comments_data" in issue:
-                row[FIELD_COMMENTS] = sanitise_for_csv(
-                    "\n".join(f"{c['user']['login']}: {c['body']}" for c in issue.get("comments_data", []))
-                )
-            
-            if FIELD_PROJECT_COLUMN in fields and "number" in issue:
-                column_name = get_issue_project_column(issue["number"])
-                row[FIELD_PROJECT_COLUMN] = "" if column_name == "No status set" or column_name is None else column_name
-                
-            if FIELD_ASSIGNEES in fields:
-                row[FIELD_ASSIGNEES] = ", ".join(a["login"] for a in issue.get("assignees", []))
-                
-            if FIELD_MILESTONE in fields and "milestone" in issue and issue["milestone"]:
-                row[FIELD_MILESTONE] = issue["milestone"]["title"]
-                
-            if FIELD_URL in fields:
-                row[FIELD_URL] = issue.get("html_url", "")
-                
-            if FIELD_BODY in fields:
-                row[FIELD_BODY] = sanitise_for_csv(issue.get("body") or "")
-            
-            writer.writerow(row)
+    with open(output_path, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile, quoting=csv.QUOTE_ALL, escapechar="\\")
+        writer.writerow(fields)
+        writer.writerows(_iter_rows(issues, fields))
 
-def export_to_excel(issues: List[Issue], output_path: str, fields: List[str]) -> None:
+def export_to_excel(issues: Iterable[IssueRec], output_path: str, fields: List[str]) -> None:
     """Export issues to Excel format."""
     if not OPTIONAL_DEPS_AVAILABLE:
         raise ImportError("pandas and openpyxl are required for Excel export. Install with: pip install pandas openpyxl")
         
-    # Convert issues to pandas DataFrame
-    data = []
-    for issue in issues:
-        row = {}
+    df = pd.DataFrame(list(_iter_rows(issues, fields)), columns=fields)
+    if XLSXWRITER_AVAILABLE:
+        # constant_memory flushes each row to disk as it is written instead of building the sheet in memory
+        with pd.ExcelWriter(output_path, engine="xlsxwriter",
+                            engine_kwargs={"options": {"constant_memory": True}}) as writer:
+            df.to_excel(writer, index=False)
+    else:
+        df.to_excel(output_path, index=False)
+
+class _JsonRecordWriter:
+    """
+    Write issues to a binary stream one at a time, as a JSON array or as JSON Lines.
+    
+    Each issue is serialized as soon as it is written, so neither the issue list
+    nor the encoded document has to be held in memory.
+    """
+    
+    def __init__(self, stream: Any, lines: bool):
+        self._stream = stream
+        self._lines = lines
+        self.count = 0
+        if not lines:
+            stream.write(b"[")
+    
+    def write(self, issue: IssueRec) -> None:
+        issue.project_column = _project_column(issue) or None
+        if not self._lines:
+            self._stream.write(b",\n" if self.count else b"\n")
+        self._stream.write(_dumps(issue))
+        if self._lines:
+            self._stream.write(b"\n")
+        self.count += 1
+    
+    def close(self) -> None:
+        if not self._lines:
+            self._stream.write(b"\n]\n" if self.count else b"]\n")
+
+def export_to_json(issues: Iterable[IssueRec], output_path: str, *, lines: bool = False) -> None:
+    """Export issues to JSON format, or to JSON Lines when lines is set."""
+    with open(output_path, "wb", buffering=CSV_WRITE_BUFFER_SIZE) as jsonfile:
+        writer = _JsonRecordWriter(jsonfile, lines)
+        for issue in issues:
+            writer.write(issue)
+        writer.close()
+
+# ----------------------------------------------------------------------
+# Export pipeline
+# ----------------------------------------------------------------------
+# Formats whose records carry the project column regardless of the selected fields
+_JSON_FORMATS = (ExportFormat.JSON, ExportFormat.JSONL)
+
+def _graphql_url(api_url: str) -> str:
+    """Derive the GraphQL endpoint from a REST API base URL."""
+    if api_url.endswith("/api/v3"):
+        return api_url[: -len("/api/v3")] + "/api/graphql"
+    return api_url.rstrip("/") + "/graphql"
+
+def _build_headers(repo: str, token: Optional[str]) -> Dict[str, str]:
+    """Validate the export target and return the request headers for it."""
+    if not validate_repo_format(repo):
+        raise ValueError(f"Invalid repository format: {repo!r} (expected org/repo)")
+    if not token:
+        raise ValueError("A GitHub token is required. Pass token= or set the GH_TOKEN environment variable.")
+    if not validate_token(token):
+        log.warning("GitHub token does not look like a valid token; continuing anyway")
+    return {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "gh-issues-to-csv",
+    }
+
+if OPTIONAL_DEPS_AVAILABLE:
+    async def _produce_issues(queue: asyncio.Queue, repo: str, *, api_url: str, graphql_url: str, headers: dict,
+                              include_comments: bool, include_statuses: bool,
+                              filter_params: Optional[IssueFilter]) -> None:
+        """Fetch issues page by page and push them onto queue, followed by a None sentinel."""
+        try:
+            async for page in iter_issue_pages_graphql(
+                repo, graphql_url=graphql_url, headers=headers,
+                filter_params=filter_params, include_comments=include_comments
+            ):
+                # Comment tails and project statuses for the page are fetched concurrently
+                processed, statuses = await asyncio.gather(
+                    process_issues_batch(page, repo, api_url=api_url, headers=headers,
+                                         include_comments=include_comments),
+                    fetch_project_statuses_async(repo, [issue.number for issue in page],
+                                                 graphql_url=graphql_url, headers=headers)
+                    if include_statuses else asyncio.sleep(0, result={})
+                )
+                _apply_project_statuses(processed, statuses)
+                for issue in processed:
+                    await queue.put(issue)
+        finally:
+            await queue.put(None)
+
+    async def _writer(queue: asyncio.Queue, fields: List[str], output_path: str) -> int:
+        """
+        Drain issues from queue into a CSV file until the None sentinel arrives.
         
-        if FIELD_ISSUE_NUMBER in fields and "number" in issue:
-            row[FIELD_ISSUE_NUMBER] = issue["number"]
+        The file is opened once and owned by this single task, since csv.writer
+        is not safe to share. Returns the number of rows written.
+        """
+        extractors = _row_extractors(fields)
+        count = 0
+        with open(output_path, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile, quoting=csv.QUOTE_ALL, escapechar="\\")
+            writer.writerow(fields)
+            
+            issue = await queue.get()
+            while issue is not None:
+                writer.writerow([extract(issue) for extract in extractors])
+                count += 1
+                issue = await queue.get()
+        return count
+
+    async def _json_writer(queue: asyncio.Queue, output_path: str, lines: bool) -> int:
+        """Drain issues from queue into a JSON or JSON Lines file until the None sentinel arrives."""
+        with open(output_path, "wb", buffering=CSV_WRITE_BUFFER_SIZE) as jsonfile:
+            writer = _JsonRecordWriter(jsonfile, lines)
+            while (issue := await queue.get()) is not None:
+                writer.write(issue)
+            writer.close()
+        return writer.count
+
+    async def _collect(queue: asyncio.Queue) -> List[IssueRec]:
+        """Drain issues from queue into a list until the None sentinel arrives."""
+        issues: List[IssueRec] = []
+        while (issue := await queue.get()) is not None:
+            issues.append(issue)
+        return issues
+
+    async def export_github_issues_async(repo: str = DEFAULT_REPO, token: Optional[str] = None,
+                                         include_comments: bool = True, output_path: str = "github_issues.csv", *,
+                                         fields: Optional[List[str]] = None,
+                                         filter_params: Optional[IssueFilter] = None,
+                                         api_url: str = DEFAULT_GITHUB_API_URL) -> int:
+        """
+        Export issues to output_path and return the number of issues exported.
         
-        if FIELD_TITLE in fields:
-            row[FIELD_TITLE] = sanitise_for_csv(issue.get("title", ""))
+        For CSV, JSON and JSON Lines output, fetching and writing run as a
+        producer/consumer pipeline: issues are written as each page arrives, so
+        memory stays bounded by EXPORT_QUEUE_SIZE rather than the size of the
+        repository. Excel output is written once all issues have been fetched.
+        """
+        headers = _build_headers(repo, token or DEFAULT_TOKEN)
+        graphql_url = _graphql_url(api_url)
+        fields = fields or DEFAULT_FIELDS
+        export_format = get_export_format(output_path)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=EXPORT_QUEUE_SIZE)
         
-        if FIELD_STATE in fields:
-            row[FIELD_STATE] = issue.get("state", "")
+        try:
+            producer = _produce_issues(
+                queue, repo, api_url=api_url, graphql_url=graphql_url, headers=headers,
+                include_comments=include_comments,
+                include_statuses=FIELD_PROJECT_COLUMN in fields or export_format in _JSON_FORMATS,
+                filter_params=filter_params
+            )
+            
+            if export_format == ExportFormat.CSV:
+                _, count = await asyncio.gather(producer, _writer(queue, fields, output_path))
+            elif export_format in _JSON_FORMATS:
+                _, count = await asyncio.gather(
+                    producer, _json_writer(queue, output_path, lines=export_format == ExportFormat.JSONL)
+                )
+            else:
+                _, issues = await asyncio.gather(producer, _collect(queue))
+                export_to_excel(issues, output_path, fields)
+                count = len(issues)
+        finally:
+            await close_session()
         
-        if FIELD_CREATED_DATE in fields and "created_at" in issue:
-            row[FIELD_CREATED_DATE] = issue["created_at"].split("T")[0] if issue["created_at"] else ""
+        log.info(f"Exported {count} issues to {output_path}")
+        return count
+
+    async def fetch_issues_async(repo: str, token: Optional[str], include_comments: bool, *,
+                                 include_statuses: bool, filter_params: Optional[IssueFilter],
+                                 api_url: str) -> List[IssueRec]:
+        """Fetch issues into memory through the same pipeline export_github_issues_async writes from."""
+        headers = _build_headers(repo, token or DEFAULT_TOKEN)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=EXPORT_QUEUE_SIZE)
+        try:
+            _, issues = await asyncio.gather(
+                _produce_issues(
+                    queue, repo, api_url=api_url, graphql_url=_graphql_url(api_url), headers=headers,
+                    include_comments=include_comments, include_statuses=include_statuses,
+                    filter_params=filter_params
+                ),
+                _collect(queue)
+            )
+        finally:
+            await close_session()
+        return issues
+
+def _fetch_issues_sync(repo: str, token: Optional[str], include_comments: bool, *,
+                       include_statuses: bool, filter_params: Optional[IssueFilter],
+                       api_url: str) -> List[IssueRec]:
+    """Synchronous REST-only fetch used when the optional async dependencies are missing."""
+    headers = _build_headers(repo, token or DEFAULT_TOKEN)
+    issues = [IssueRec.from_dict(issue)
+              for issue in get_issues(repo, api_url=api_url, headers=headers, filter_params=filter_params)]
+    for issue in issues:
+        issue.comments_data = (
+            get_comments(repo, issue.number, api_url=api_url, headers=headers) if include_comments else []
+        )
+    if include_statuses:
+        _apply_project_statuses(issues, fetch_project_statuses(repo, [issue.number for issue in issues],
+                                                              graphql_url=_graphql_url(api_url), headers=headers))
+    return issues
+
+def _export_github_issues_sync(repo: str, token: Optional[str], include_comments: bool, output_path: str, *,
+                               fields: Optional[List[str]], filter_params: Optional[IssueFilter],
+                               api_url: str) -> int:
+    """Synchronous REST-only export used when the optional async dependencies are missing."""
+    fields = fields or DEFAULT_FIELDS
+    export_format = get_export_format(output_path)
+    issues = _fetch_issues_sync(
+        repo, token, include_comments,
+        include_statuses=FIELD_PROJECT_COLUMN in fields or export_format in _JSON_FORMATS,
+        filter_params=filter_params, api_url=api_url
+    )
+    
+    if export_format == ExportFormat.EXCEL:
+        export_to_excel(issues, output_path, fields)
+    elif export_format in _JSON_FORMATS:
+        export_to_json(issues, output_path, lines=export_format == ExportFormat.JSONL)
+    else:
+        export_to_csv(issues, output_path, fields)
+    
+    log.info(f"Exported {len(issues)} issues to {output_path}")
+    return len(issues)
+
+def export_github_issues(repo: str = DEFAULT_REPO, token: Optional[str] = None,
+                         include_comments: bool = True, output_path: str = "github_issues.csv", *,
+                         fields: Optional[List[str]] = None,
+                         filter_params: Optional[IssueFilter] = None,
+                         api_url: str = DEFAULT_GITHUB_API_URL,
+                         cache_dir: Optional[str] = None) -> int:
+    """
+    Export GitHub issues to CSV, Excel, JSON, or JSON Lines (chosen from output_path's extension).
+    
+    Args:
+        repo: GitHub repository in format 'owner/repo'
+        token: GitHub token (defaults to the GH_TOKEN environment variable)
+        include_comments: Whether to fetch issue comments
+        output_path: Destination file
+        fields: Columns to export (defaults to DEFAULT_FIELDS)
+        filter_params: Optional IssueFilter to restrict the exported issues
+        api_url: GitHub REST API base URL
+        cache_dir: Optional directory for a persistent ETag cache of REST pages
+        
+    Returns:
+        Number of issues exported
+    """
+    with persistent_etag_cache(cache_dir):
+        if OPTIONAL_DEPS_AVAILABLE:
+            return asyncio.run(export_github_issues_async(
+                repo, token, include_comments, output_path,
+                fields=fields, filter_params=filter_params, api_url=api_url
+            ))
+        return _export_github_issues_sync(
+            repo, token, include_comments, output_path,
+            fields=fields, filter_params=filter_params, api_url=api_url
+        )
+
+def fetch_issue_rows(repo: str = DEFAULT_REPO, token: Optional[str] = None,
+                     include_comments: bool = True, *,
+                     fields: Optional[List[str]] = None,
+                     filter_params: Optional[IssueFilter] = None,
+                     api_url: str = DEFAULT_GITHUB_API_URL,
+                     cache_dir: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Fetch GitHub issues as row dicts keyed by field name, without writing a file.
+    
+    Each row holds the same values the CSV export would write, so callers that
+    build a DataFrame can skip the CSV round trip. cache_dir works as in
+    export_github_issues.
+    """
+    fields = fields or DEFAULT_FIELDS
+    fetch_args = dict(include_statuses=FIELD_PROJECT_COLUMN in fields, filter_params=filter_params, api_url=api_url)
+    with persistent_etag_cache(cache_dir):
+        if OPTIONAL_DEPS_AVAILABLE:
+            issues = asyncio.run(fetch_issues_async(repo, token, include_comments, **fetch_args))
+        else:
+            issues = _fetch_issues_sync(repo, token, include_comments, **fetch_args)
+    return [dict(zip(fields, row)) for row in _iter_rows(issues, fields)]
+
+# ----------------------------------------------------------------------
+# CLI
+# ----------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export GitHub issues to CSV, Excel, JSON, or JSON Lines.")
+    parser.add_argument("--repo", default=DEFAULT_REPO, help="GitHub repository in format 'owner/repo'")
+    parser.add_argument("--token", default=DEFAULT_TOKEN, help="GitHub token (defaults to $GH_TOKEN)")
+    parser.add_argument("--output", default="github_issues.csv",
+                        help="Output file; .csv, .xlsx, .json or .jsonl selects the format")
+    parser.add_argument("--api-url", default=DEFAULT_GITHUB_API_URL, help="GitHub REST API base URL")
+    parser.add_argument("--no-comments", action="store_true", help="Skip fetching issue comments")
+    parser.add_argument("--state", choices=["open", "closed", "all"], default="all", help="Issue state to export")
+    parser.add_argument("--labels", help="Comma-separated list of labels to filter by")
+    parser.add_argument("--since", help="Only issues updated since this date (YYYY-MM-DD or ISO 8601)")
+    parser.add_argument("--cache-dir", help="Directory for a persistent ETag cache, so unchanged pages "
+                                            "are not re-downloaded on later runs")
+    args = parser.parse_args()
+    
+    filter_params = IssueFilter(
+        state=args.state,
+        labels=[label.strip() for label in args.labels.split(",")] if args.labels else None,
+        since=args.since
+    )
+    
+    try:
+        count = export_github_issues(
+            repo=args.repo,
+            token=args.token,
+            include_comments=not args.no_comments,
+            output_path=args.output,
+            filter_params=filter_params,
+            api_url=args.api_url,
+            cache_dir=args.cache_dir
+        )
+    except (ValueError, ImportError, requests.exceptions.RequestException) as e:
+        sys.stderr.write(f"❌  Error: {e}\n")
+        sys.exit(1)
+    
+    print(f"📊  Done! {count} issues written to {args.output}")
+
+if __name__ == "__main__":
+    main()
 
 # Made with Bob
@@ -17,12 +17,16 @@ Features:
 Dependencies:
     - ibm-watsonx-orchestrate
     - All dependencies from gh_issues_tool.py
+    - scikit-learn (optional; similar-issue detection)
 """
 
 import os
+import re
 import sys
 import json
 import logging
+import threading
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Union, Tuple
@@ -36,7 +40,7 @@ except ImportError:
 
 # Try to import the GitHub issues tool
 try:
-    from gh_issues_tool import export_github_issues
+    from gh_issues_tool import fetch_issue_rows, DEFAULT_FIELDS
 except ImportError:
     print("gh_issues_tool.py must be in the same directory or in the Python path")
     sys.exit(1)
@@ -48,6 +52,14 @@ except ImportError:
     print("ibm-watsonx-orchestrate is required. Please install it with: pip install --upgrade ibm-watsonx-orchestrate")
     sys.exit(1)
 
+# Optional: TF-IDF vectors for similar-issue detection
+try:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from scipy.sparse import triu
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -60,34 +72,82 @@ log = logging.getLogger(__name__)
 DEFAULT_GITHUB_TOKEN = os.getenv("GH_TOKEN")
 DEFAULT_REPO = os.getenv("GH_REPO", "kwright15/github-issues-tool")
 DEFAULT_OUTPUT_FILE = "github_issues_analysis.json"
+# Exported date columns, parsed to datetimes once when the issues are loaded
+DATE_COLUMNS = ('Created Date', 'Closed Date', 'Updated Date')
+
+# Words ignored when looking for trending themes in issue titles
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'in', 'on', 'at', 'to', 'for', 'with', 'is', 'are'})
+# Anything that is not a word character or whitespace, stripped from titles before counting words
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+STOP_RE = re.compile(r'\b(?:' + '|'.join(sorted(STOP_WORDS)) + r')\b')
+# Number of trending themes reported by summarize_issues
+TRENDING_THEMES_COUNT = 10
+# Product name from a "product:xyz" entry in a comma-separated label list
+PRODUCT_LABEL_RE = re.compile(r'(?:^|,)\s*product:([^,:]*)')
 
 class GitHubIssuesAnalyzer:
     """Main class for analyzing GitHub issues."""
     
-    def __init__(self, repo: str, token: Optional[str] = None, output_file: str = DEFAULT_OUTPUT_FILE):
-        """Initialize the analyzer with repository and authentication details."""
+    def __init__(self, repo: str, token: Optional[str] = None, output_file: str = DEFAULT_OUTPUT_FILE,
+                 cache_dir: Optional[str] = None):
+        """Initialize the analyzer with repository and authentication details.
+        
+        cache_dir, when given, keeps REST response ETags on disk so a later process
+        can revalidate unchanged REST pages (the sync fallback's issue pages, and
+        comment pages beyond the first 100 comments) instead of downloading them again.
+        """
         self.repo = repo
         self.token = token or DEFAULT_GITHUB_TOKEN
         self.output_file = output_file
+        self.cache_dir = cache_dir
         self.issues_df = None
+        self.time_to_close = None
+        # Upper-triangular pairwise similarity of the loaded issues, built on first use
+        self._similarity = None
+        self._similarity_lock = threading.Lock()
+        # Title words of the loaded issues, built on first use
+        self._title_words = None
+        
+    @classmethod
+    def from_issues(cls, repo: str, rows: List[Dict[str, Any]], token: Optional[str] = None) -> "GitHubIssuesAnalyzer":
+        """Create an analyzer over issue rows that were already fetched (see fetch_issue_rows)."""
+        analyzer = cls(repo=repo, token=token)
+        analyzer.load_issues(rows)
+        return analyzer
         
     def fetch_issues(self, include_comments: bool = True) -> pd.DataFrame:
         """Fetch issues from GitHub and convert to DataFrame."""
-        # Use the export_github_issues function to get issues in CSV format
-        temp_csv = "temp_issues.csv"
-        export_github_issues(
+        rows = fetch_issue_rows(
             repo=self.repo,
             token=self.token,
             include_comments=include_comments,
-            output_path=temp_csv
+            cache_dir=self.cache_dir
         )
+        return self.load_issues(rows)
+    
+    def load_issues(self, rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Build the issues DataFrame from exported row dicts."""
+        # Build the frame straight from the exported rows instead of a temporary CSV
+        df = pd.DataFrame.from_records(rows, columns=DEFAULT_FIELDS)
         
-        # Load the CSV into a DataFrame
-        self.issues_df = pd.read_csv(temp_csv)
-        
-        # Clean up the temporary file
-        if os.path.exists(temp_csv):
-            os.remove(temp_csv)
+        # Empty cells become NaN, as they did when read back from CSV
+        df = df.mask(df == "")
+        # Low-cardinality text columns are stored as categories: one copy of each distinct value
+        for col in ('State', 'Project Column'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        # Parse dates once here so the analysis methods can use them directly
+        for col in DATE_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], format='%Y-%m-%d', errors='coerce')
+        self.issues_df = df
+        self._similarity = None
+        self._title_words = None
+        # Days from creation to close; NaN for issues that are still open
+        if 'Created Date' in df.columns and 'Closed Date' in df.columns:
+            self.time_to_close = (df['Closed Date'] - df['Created Date']).dt.days
+        else:
+            self.time_to_close = None
             
         return self.issues_df
     
@@ -124,7 +184,6 @@ class GitHubIssuesAnalyzer:
             else:
                 start_date = now - timedelta(days=30)  # Default to 1 month
                 
-            df['Created Date'] = pd.to_datetime(df['Created Date'])
             df = df[df['Created Date'] >= start_date]
         
         summary = {
@@ -140,45 +199,50 @@ class GitHubIssuesAnalyzer:
             # This is a placeholder - adjust based on your actual data structure
             if 'Labels' in df.columns:
                 # Extract product from labels (assuming format like "product:xyz")
-                df['Product'] = df['Labels'].apply(
-                    lambda x: next((label.split(':')[1] for label in str(x).split(',') 
-                                   if label.strip().startswith('product:')), 'unknown')
-                )
+                df['Product'] = df['Labels'].astype(str).str.extract(PRODUCT_LABEL_RE, expand=False).fillna('unknown')
                 product_summary = df.groupby('Product').size().to_dict()
                 summary["by_product"] = product_summary
         
         # Group by tag if requested
         if by_tag:
             if 'Labels' in df.columns:
-                # Explode labels into separate rows
-                all_labels = []
-                for labels in df['Labels'].dropna():
-                    all_labels.extend([label.strip() for label in str(labels).split(',')])
-                
-                # Count occurrences of each label
-                label_counts = pd.Series(all_labels).value_counts().to_dict()
-                summary["by_tag"] = label_counts
+                # Explode labels into separate rows and count occurrences of each label
+                all_labels = df['Labels'].dropna().astype(str).str.split(',').explode().str.strip()
+                summary["by_tag"] = all_labels.value_counts().to_dict()
         
         # Find trending themes (most common words in titles)
         if 'Title' in df.columns:
-            from collections import Counter
-            import re
-            
-            # Extract words from titles
-            words = []
-            for title in df['Title'].dropna():
-                # Remove special characters and split into words
-                clean_words = re.sub(r'[^\w\s]', '', str(title).lower()).split()
-                # Filter out common stop words
-                stop_words = {'the', 'a', 'an', 'and', 'in', 'on', 'at', 'to', 'for', 'with', 'is', 'are'}
-                words.extend([word for word in clean_words if word not in stop_words and len(word) > 2])
+            words = self.title_words()
+            if len(df) != len(self.issues_df):
+                # Only the issues left after the time-period filter
+                words = words[words.index.isin(df.index)]
             
-            # Get the most common words
-            common_words = Counter(words).most_common(10)
-            summary["trending_themes"] = [{"word": word, "count": count} for word, count in common_words]
+            # Count each distinct word, then pick the most common without sorting every count
+            vals, counts = np.unique(words.to_numpy(dtype=str), return_counts=True)
+            k = min(TRENDING_THEMES_COUNT, len(vals))
+            top = np.sort(np.argpartition(-counts, k - 1)[:k]) if k else np.empty(0, dtype=int)
+            # Highest count first; ties stay in alphabetical order
+            top = top[np.argsort(-counts[top], kind='stable')]
+            summary["trending_themes"] = [{"word": str(vals[i]), "count": int(counts[i])} for i in top]
         
         return summary
     
+    def title_words(self) -> pd.Series:
+        """
+        Words of each loaded issue's title, computed once and reused.
+        
+        Titles are lowercased with punctuation and stop words removed; words of two
+        characters or fewer are dropped. The Series has one row per word, indexed
+        by the issue's row in issues_df.
+        """
+        if self._title_words is None:
+            words = (self.issues_df['Title'].dropna().astype(str).str.lower()
+                     .str.replace(PUNCTUATION_RE, '', regex=True)
+                     .str.replace(STOP_RE, '', regex=True)
+                     .str.split().explode().dropna())
+            self._title_words = words[words.str.len() > 2]
+        return self._title_words
+    
     def analyze_metrics(self) -> Dict[str, Any]:
         """
         Analyze metrics like issue counts, time-to-close, and PM responsiveness.
@@ -189,34 +253,26 @@ class GitHubIssuesAnalyzer:
         if self.issues_df is None:
             self.fetch_issues()
             
-        df = self.issues_df.copy() if self.issues_df is not None else pd.DataFrame()
-        
-        # Convert date columns to datetime
-        for col in ['Created Date', 'Closed Date', 'Updated Date']:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
+        # Date columns are already parsed by fetch_issues, so nothing here modifies the frame
+        df = self.issues_df if self.issues_df is not None else pd.DataFrame()
         
-        # Calculate time-to-close for closed issues
         metrics = {}
         
         # Issue counts over time
         if 'Created Date' in df.columns:
             # Group by month
-            df['month'] = df['Created Date'].dt.to_period('M')
-            monthly_counts = df.groupby('month').size()
+            monthly_counts = df.groupby(df['Created Date'].dt.to_period('M')).size()
             metrics["monthly_issue_counts"] = {str(idx): int(count) for idx, count in monthly_counts.items()}
         
-        # Time-to-close metrics
-        if 'Created Date' in df.columns and 'Closed Date' in df.columns:
-            closed_issues = df.dropna(subset=['Closed Date'])
-            if not closed_issues.empty:
-                closed_issues['time_to_close'] = (closed_issues['Closed Date'] - closed_issues['Created Date']).dt.days
-                
+        # Time-to-close metrics for closed issues
+        if self.time_to_close is not None:
+            time_to_close = self.time_to_close.dropna()
+            if not time_to_close.empty:
                 metrics["time_to_close"] = {
-                    "mean_days": closed_issues['time_to_close'].mean(),
-                    "median_days": closed_issues['time_to_close'].median(),
-                    "min_days": closed_issues['time_to_close'].min(),
-                    "max_days": closed_issues['time_to_close'].max()
+                    "mean_days": time_to_close.mean(),
+                    "median_days": time_to_close.median(),
+                    "min_days": time_to_close.min(),
+                    "max_days": time_to_close.max()
                 }
         
         # PM responsiveness (time to first comment)
@@ -232,36 +288,77 @@ class GitHubIssuesAnalyzer:
         
         return metrics
     
-    def detect_similar_issues(self, threshold: float = 0.7) -> List[Dict[str, Any]]:
+    def detect_similar_issues(self, threshold: float = 0.7, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Detect similar or duplicate issues.
         
         Args:
             threshold: Similarity threshold (0.0 to 1.0)
+            limit: Maximum number of groups to return (highest scores first), or None for all
             
         Returns:
             List of similar issue groups
         """
         if self.issues_df is None:
             self.fetch_issues()
+        
+        if not SKLEARN_AVAILABLE:
+            log.warning("scikit-learn is required for similarity detection. Install with: pip install scikit-learn")
+            return []
             
-        # This is a placeholder for more sophisticated similarity detection
-        # In a real implementation, you would use NLP techniques like:
-        # - TF-IDF vectorization
-        # - Cosine similarity
-        # - Embedding-based similarity
+        df = self.issues_df if self.issues_df is not None else pd.DataFrame()
+        if len(df) < 2 or 'Title' not in df.columns:
+            return []
         
-        # For now, we'll just return a simple example
+        similarity = self.similarity_matrix()
+        if similarity is None:
+            return []
+        
+        keep = similarity.data >= threshold
+        rows, cols, scores = similarity.row[keep], similarity.col[keep], similarity.data[keep]
+        # Highest score first; ties broken by descending issue position, as before
+        order = np.lexsort((-cols, -rows, -scores))[:limit]
+        pairs = zip(scores[order], rows[order], cols[order])
+        
+        numbers = df['Issue Number'].tolist() if 'Issue Number' in df.columns else list(range(len(df)))
+        titles = df['Title'].fillna('').astype(str).tolist()
         return [
             {
-                "group_id": 1,
-                "issues": [{"number": 1, "title": "Example Issue 1"}, 
-                          {"number": 2, "title": "Example Issue 2"}],
-                "similarity_score": 0.85,
+                "group_id": group_id,
+                "issues": [{"number": numbers[i], "title": titles[i]},
+                           {"number": numbers[j], "title": titles[j]}],
+                "similarity_score": round(float(score), 4),
                 "recommendation": "Consider merging these issues"
             }
+            for group_id, (score, i, j) in enumerate(pairs, start=1)
         ]
     
+    def similarity_matrix(self):
+        """
+        Pairwise cosine similarity of the loaded issues, computed once and reused.
+        
+        Returns:
+            Upper-triangular scipy COO matrix (row i < column j), or None when the
+            issue text has no usable terms
+        """
+        # Lock so concurrent callers (e.g. two thresholds at once) vectorise only once
+        with self._similarity_lock:
+            if self._similarity is None:
+                # TF-IDF over title (and body, when exported), compared all-pairs in one sparse product
+                df = self.issues_df
+                text = df['Title'].fillna('').astype(str)
+                if 'Body' in df.columns:
+                    text = text + ' ' + df['Body'].fillna('').astype(str)
+                try:
+                    vectors = TfidfVectorizer(stop_words='english', max_features=5000, ngram_range=(1, 2)).fit_transform(text)
+                except ValueError:
+                    # Every document was empty or only stop words
+                    return None
+                # TF-IDF rows are already L2-normalised, so the plain product is the cosine similarity.
+                # Kept on the analyzer so calls with other thresholds skip the vectorising.
+                self._similarity = triu(vectors @ vectors.T, k=1, format='coo')
+            return self._similarity
+    
     def suggest_tags(self, issue_number: Optional[int] = None) -> Dict[str, Any]:
         """
         Suggest tags based on issue content.
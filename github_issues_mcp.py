@@ -13,11 +13,17 @@ Usage:
 
 import os
 import json
+import time
+import functools
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Callable, NamedTuple, TYPE_CHECKING
 
-# Import the analyzer class
-from github_issues_agent import GitHubIssuesAnalyzer
+# The analyzer pulls in pandas (and scikit-learn when installed), so it is imported on first use
+if TYPE_CHECKING:
+    from github_issues_agent import GitHubIssuesAnalyzer
 
 # Set up logging
 logging.basicConfig(
@@ -30,7 +36,135 @@ log = logging.getLogger(__name__)
 # Constants
 DEFAULT_GITHUB_TOKEN = os.getenv("GH_TOKEN")
 DEFAULT_REPO = os.getenv("GH_REPO", "kwright15/github-issues-tool")
+# How long a fetched analyzer is reused before its issues are fetched again
+ANALYZER_CACHE_TTL_SECONDS = 120
+# Fetched issue rows are saved here so a restarted MCP process starts warm; set GH_ISSUES_CACHE_DIR
+# to an empty string to turn this off
+ISSUE_CACHE_DIR = os.getenv("GH_ISSUES_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "github_issues_tool"))
+# Oldest saved rows a restarted process will start from, in seconds
+ISSUE_CACHE_MAX_AGE_SECONDS = int(os.getenv("GH_ISSUES_CACHE_MAX_AGE", "3600"))
+# Worker threads for mcp_batch; one per analysis tool
+BATCH_MAX_WORKERS = 5
+# Most similar-issue groups returned by one call; the pair count grows with the square of the issue count
+MAX_SIMILAR_GROUPS = 1000
 
+# Analyzers with their issues already fetched, keyed by (repo, token digest).
+# The token itself is never kept as a key; only its blake2b digest is.
+_analyzer_cache: Dict[Tuple[str, str], Tuple[float, "GitHubIssuesAnalyzer"]] = {}
+_analyzer_cache_lock = threading.Lock()
+# gh_issues_tool keeps its async client, semaphore and event-loop binding in module globals,
+# so only one fetch may run at a time; this also makes concurrent misses share one fetch.
+_fetch_lock = threading.Lock()
+
+def _mcp_tool(action: str) -> Callable[[Callable[..., Any]], Callable[..., Dict[str, Any]]]:
+    """
+    Wrap an MCP tool body in the standard response envelope.
+    
+    The wrapped function returns {"status": "success", "data": <result>}, or
+    {"status": "error", "message": ...} after logging "Error <action>: ...".
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Dict[str, Any]]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            try:
+                return {"status": "success", "data": func(*args, **kwargs)}
+            except Exception as e:
+                log.error("Error %s: %s", action, e)
+                return {"status": "error", "message": str(e)}
+        return wrapper
+    return decorator
+
+def _rows_cache_path(key: Tuple[str, str]) -> str:
+    """Return the saved-rows file for a (repo, token digest) analyzer cache key."""
+    name = hashlib.blake2b("\0".join(key).encode(), digest_size=16).hexdigest()
+    return os.path.join(ISSUE_CACHE_DIR, f"issues-{name}.json")
+
+def _load_saved_rows(key: Tuple[str, str]) -> Optional[List[Dict[str, Any]]]:
+    """Return the issue rows saved for key within ISSUE_CACHE_MAX_AGE_SECONDS, or None."""
+    if not ISSUE_CACHE_DIR:
+        return None
+    path = _rows_cache_path(key)
+    try:
+        if os.path.getmtime(path) < time.time() - ISSUE_CACHE_MAX_AGE_SECONDS:
+            return None
+        with open(path, 'rb') as f:
+            saved = json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        log.warning("Could not read saved issues %s: %s", path, e)
+        return None
+    if saved.get("repo") != key[0]:
+        return None
+    log.info("Using saved issues for %s from %s", key[0], path)
+    return saved["rows"]
+
+def _save_rows(key: Tuple[str, str], rows: List[Dict[str, Any]]) -> None:
+    """Save fetched issue rows for key, replacing the file atomically; failures are only logged."""
+    if not ISSUE_CACHE_DIR:
+        return
+    path = _rows_cache_path(key)
+    # Per-process temporary name, so two MCP processes saving at once do not interleave
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(ISSUE_CACHE_DIR, exist_ok=True)
+        # The rows may come from a private repository, so only the owner can read them
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+            json.dump({"repo": key[0], "rows": rows}, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        log.warning("Could not save issues to %s: %s", path, e)
+
+def _get_analyzer(repo: str, token: Optional[str], ttl: float = ANALYZER_CACHE_TTL_SECONDS) -> "GitHubIssuesAnalyzer":
+    """
+    Return an analyzer for repo with its issues loaded, reusing one fetched within the last ttl seconds.
+    
+    The first load of a repository in this process starts from rows saved by an
+    earlier process when they are recent enough (see ISSUE_CACHE_MAX_AGE_SECONDS);
+    later loads always fetch, so issues are never more than ttl seconds stale after that.
+    
+    Args:
+        repo: GitHub repository in format 'owner/repo'
+        token: GitHub token (optional if GH_TOKEN env var is set)
+        ttl: Maximum age in seconds of a cached analyzer
+        
+    Returns:
+        GitHubIssuesAnalyzer with issues_df populated
+    """
+    token = token or DEFAULT_GITHUB_TOKEN
+    key = (repo, hashlib.blake2b((token or "").encode(), digest_size=8).hexdigest())
+    
+    def fresh() -> Optional["GitHubIssuesAnalyzer"]:
+        with _analyzer_cache_lock:
+            cached = _analyzer_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return None
+    
+    analyzer = fresh()
+    if analyzer is not None:
+        return analyzer
+    
+    from github_issues_agent import GitHubIssuesAnalyzer
+    from gh_issues_tool import fetch_issue_rows
+    
+    with _fetch_lock:
+        # Another thread may have fetched this repository while we waited
+        analyzer = fresh()
+        if analyzer is not None:
+            return analyzer
+        with _analyzer_cache_lock:
+            first_load = key not in _analyzer_cache
+        rows = _load_saved_rows(key) if first_load else None
+        if rows is None:
+            rows = fetch_issue_rows(repo=repo, token=token)
+            _save_rows(key, rows)
+        analyzer = GitHubIssuesAnalyzer.from_issues(repo, rows, token=token)
+        with _analyzer_cache_lock:
+            _analyzer_cache[key] = (time.monotonic(), analyzer)
+    return analyzer
+
+@_mcp_tool("summarizing issues")
 def mcp_summarize_issues(
     repo: str = DEFAULT_REPO,
     token: Optional[str] = None,
@@ -51,20 +185,10 @@ def mcp_summarize_issues(
     Returns:
         Summary of issues
     """
-    try:
-        analyzer = GitHubIssuesAnalyzer(repo=repo, token=token)
-        result = analyzer.summarize_issues(by_product=by_product, by_tag=by_tag, time_period=time_period)
-        return {
-            "status": "success",
-            "data": result
-        }
-    except Exception as e:
-        log.error(f"Error summarizing issues: {str(e)}")
-        return {
-            "status": "error",
-            "message": str(e)
-        }
+    analyzer = _get_analyzer(repo, token)
+    return analyzer.summarize_issues(by_product=by_product, by_tag=by_tag, time_period=time_period)
 
+@_mcp_tool("analyzing metrics")
 def mcp_analyze_metrics(
     repo: str = DEFAULT_REPO,
     token: Optional[str] = None
@@ -79,20 +203,10 @@ def mcp_analyze_metrics(
     Returns:
         Analytics information
     """
-    try:
-        analyzer = GitHubIssuesAnalyzer(repo=repo, token=token)
-        result = analyzer.analyze_metrics()
-        return {
-            "status": "success",
-            "data": result
-        }
-    except Exception as e:
-        log.error(f"Error analyzing metrics: {str(e)}")
-        return {
-            "status": "error",
-            "message": str(e)
-        }
+    analyzer = _get_analyzer(repo, token)
+    return analyzer.analyze_metrics()
 
+@_mcp_tool("detecting similar issues")
 def mcp_detect_similar_issues(
     repo: str = DEFAULT_REPO,
     token: Optional[str] = None,
@@ -107,22 +221,12 @@ def mcp_detect_similar_issues(
         threshold: Similarity threshold (0.0 to 1.0)
         
     Returns:
-        List of similar issue groups
+        List of similar issue groups, at most MAX_SIMILAR_GROUPS of the highest-scoring
     """
-    try:
-        analyzer = GitHubIssuesAnalyzer(repo=repo, token=token)
-        result = analyzer.detect_similar_issues(threshold=threshold)
-        return {
-            "status": "success",
-            "data": result
-        }
-    except Exception as e:
-        log.error(f"Error detecting similar issues: {str(e)}")
-        return {
-            "status": "error",
-            "message": str(e)
-        }
+    analyzer = _get_analyzer(repo, token)
+    return analyzer.detect_similar_issues(threshold=threshold, limit=MAX_SIMILAR_GROUPS)
 
+@_mcp_tool("suggesting tags")
 def mcp_suggest_tags(
     repo: str = DEFAULT_REPO,
     token: Optional[str] = None,
@@ -139,20 +243,10 @@ def mcp_suggest_tags(
     Returns:
         Tag suggestions
     """
-    try:
-        analyzer = GitHubIssuesAnalyzer(repo=repo, token=token)
-        result = analyzer.suggest_tags(issue_number=issue_number)
-        return {
-            "status": "success",
-            "data": result
-        }
-    except Exception as e:
-        log.error(f"Error suggesting tags: {str(e)}")
-        return {
-            "status": "error",
-            "message": str(e)
-        }
+    analyzer = _get_analyzer(repo, token)
+    return analyzer.suggest_tags(issue_number=issue_number)
 
+@_mcp_tool("providing CSM intelligence")
 def mcp_csm_intelligence(
     issue_title: str,
     issue_body: str,
@@ -171,26 +265,66 @@ def mcp_csm_intelligence(
     Returns:
         CSM recommendations
     """
-    try:
-        analyzer = GitHubIssuesAnalyzer(repo=repo, token=token)
-        result = analyzer.csm_intelligence(issue_title=issue_title, issue_body=issue_body)
-        return {
-            "status": "success",
-            "data": result
-        }
-    except Exception as e:
-        log.error(f"Error providing CSM intelligence: {str(e)}")
-        return {
-            "status": "error",
-            "message": str(e)
-        }
+    from github_issues_agent import GitHubIssuesAnalyzer
+    
+    # csm_intelligence does not read the fetched issues, so skip the fetch
+    analyzer = GitHubIssuesAnalyzer(repo=repo, token=token)
+    return analyzer.csm_intelligence(issue_title=issue_title, issue_body=issue_body)
+
+@_mcp_tool("running batch")
+def mcp_batch(operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    MCP tool to run several of the tools above concurrently in one call.
+    
+    Args:
+        operations: List of {"name": <tool name>, "args": {...}} entries, e.g.
+            [{"name": "github_issues_summarize", "args": {"by_tag": True}},
+             {"name": "github_issues_summarize", "args": {"by_product": True}}]
+        
+    Returns:
+        One response per operation, in operations order. An operation that
+        fails gets an {"status": "error", ...} entry; the others are unaffected.
+    """
+    unknown = [op["name"] for op in operations if op["name"] not in mcp_tools or op["name"] == "github_issues_batch"]
+    if unknown:
+        raise ValueError(f"Unknown tools in batch: {', '.join(unknown)}")
+    
+    # Load each repository's issues once up front so the workers share one fetch.
+    # CSM intelligence does not use them; a failure is left for the affected operations to report.
+    for repo, token in {(op.get("args", {}).get("repo", DEFAULT_REPO), op.get("args", {}).get("token"))
+                        for op in operations if op["name"] != "github_issues_csm_intelligence"}:
+        try:
+            _get_analyzer(repo, token)
+        except Exception as e:
+            log.warning("Could not preload issues for %s: %s", repo, e)
+    
+    with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+        futures = [executor.submit(mcp_tools[op["name"]]["function"], **op.get("args", {})) for op in operations]
+        results = []
+        for op, future in zip(operations, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                log.error("Error running %s in batch: %s", op["name"], e)
+                results.append({"status": "error", "message": str(e)})
+        return results
 
 # MCP Tool definitions for watsonx.orchestrate
-mcp_tools = {
-    "github_issues_summarize": {
-        "function": mcp_summarize_issues,
-        "description": "Summarize GitHub issues by product, tag, or time period",
-        "parameters": {
+class _ToolSpec(NamedTuple):
+    """One MCP tool: its registered name, description, implementation and parameter schema."""
+    name: str
+    description: str
+    function: Callable[..., Dict[str, Any]]
+    parameters: Dict[str, Any]
+
+# Fixed at import; register_mcp_tools walks this tuple directly. The parameter schemas are
+# shared with every registration and with mcp_tools, so treat them as read-only.
+_TOOLS: Tuple[_ToolSpec, ...] = (
+    _ToolSpec(
+        name="github_issues_summarize",
+        description="Summarize GitHub issues by product, tag, or time period",
+        function=mcp_summarize_issues,
+        parameters={
             "repo": {
                 "type": "string",
                 "description": "GitHub repository in format 'owner/repo'",
@@ -217,11 +351,12 @@ mcp_tools = {
                 "required": False
             }
         }
-    },
-    "github_issues_metrics": {
-        "function": mcp_analyze_metrics,
-        "description": "Analyze metrics like issue counts, time-to-close, and PM responsiveness",
-        "parameters": {
+    ),
+    _ToolSpec(
+        name="github_issues_metrics",
+        description="Analyze metrics like issue counts, time-to-close, and PM responsiveness",
+        function=mcp_analyze_metrics,
+        parameters={
             "repo": {
                 "type": "string",
                 "description": "GitHub repository in format 'owner/repo'",
@@ -233,11 +368,12 @@ mcp_tools = {
                 "required": False
             }
         }
-    },
-    "github_issues_detect_similar": {
-        "function": mcp_detect_similar_issues,
-        "description": "Detect similar or duplicate issues",
-        "parameters": {
+    ),
+    _ToolSpec(
+        name="github_issues_detect_similar",
+        description="Detect similar or duplicate issues",
+        function=mcp_detect_similar_issues,
+        parameters={
             "repo": {
                 "type": "string",
                 "description": "GitHub repository in format 'owner/repo'",
@@ -254,11 +390,12 @@ mcp_tools = {
                 "default": 0.7
             }
         }
-    },
-    "github_issues_suggest_tags": {
-        "function": mcp_suggest_tags,
-        "description": "Suggest tags based on issue content",
-        "parameters": {
+    ),
+    _ToolSpec(
+        name="github_issues_suggest_tags",
+        description="Suggest tags based on issue content",
+        function=mcp_suggest_tags,
+        parameters={
             "repo": {
                 "type": "string",
                 "description": "GitHub repository in format 'owner/repo'",
@@ -275,11 +412,12 @@ mcp_tools = {
                 "required": False
             }
         }
-    },
-    "github_issues_csm_intelligence": {
-        "function": mcp_csm_intelligence,
-        "description": "Provide CSM intelligence for new issues",
-        "parameters": {
+    ),
+    _ToolSpec(
+        name="github_issues_csm_intelligence",
+        description="Provide CSM intelligence for new issues",
+        function=mcp_csm_intelligence,
+        parameters={
             "issue_title": {
                 "type": "string",
                 "description": "Title of the new issue"
@@ -299,8 +437,22 @@ mcp_tools = {
                 "required": False
             }
         }
-    }
-}
+    ),
+    _ToolSpec(
+        name="github_issues_batch",
+        description="Run several GitHub issues tools concurrently and return their results in order",
+        function=mcp_batch,
+        parameters={
+            "operations": {
+                "type": "array",
+                "description": "List of {'name': tool name, 'args': tool arguments} entries"
+            }
+        }
+    )
+)
+
+# Name -> tool config, in the shape earlier callers of this module expect
+mcp_tools = {tool.name: tool._asdict() for tool in _TOOLS}
 
 # Function to register MCP tools with watsonx.orchestrate
 def register_mcp_tools():
@@ -308,18 +460,18 @@ def register_mcp_tools():
     try:
         from ibm_watsonx_orchestrate import register_tool
         
-        for tool_name, tool_config in mcp_tools.items():
+        for tool in _TOOLS:
             register_tool(
-                name=tool_name,
-                description=tool_config["description"],
-                function=tool_config["function"],
-                parameters=tool_config["parameters"]
+                name=tool.name,
+                description=tool.description,
+                function=tool.function,
+                parameters=tool.parameters
             )
         
-        log.info(f"Successfully registered {len(mcp_tools)} GitHub Issues MCP tools")
+        log.info("Successfully registered %d GitHub Issues MCP tools", len(_TOOLS))
         return True
     except Exception as e:
-        log.error(f"Error registering MCP tools: {str(e)}")
+        log.error("Error registering MCP tools: %s", e)
         return False
 
 if __name__ == "__main__":
@@ -8,10 +8,12 @@ This script publishes the GitHub Issues Analyzer agent to watsonx.orchestrate.
 """
 
 import os
+import json
 import logging
+import functools
 import sys
+import shutil
 import subprocess
-import yaml
 
 # Set up logging
 logging.basicConfig(
@@ -23,7 +25,9 @@ log = logging.getLogger(__name__)
 
 # Constants
 AGENT_DEFINITION_FILE = "github_issues_agent_definition.yaml"
+AGENT_DEFINITION_CACHE_FILE = AGENT_DEFINITION_FILE + ".json"
 AGENT_NAME = "GitHub Issues Analyzer"
+REQUIRED_AGENT_FIELDS = frozenset({'name', 'description', 'tools', 'instructions', 'model'})
 
 def register_tools():
     """Register the MCP tools with watsonx.orchestrate."""
@@ -39,44 +43,79 @@ def register_tools():
         log.info("Successfully registered GitHub Issues Analyzer MCP tools with watsonx.orchestrate")
         return True
     except Exception as e:
-        log.error(f"Error registering MCP tools: {str(e)}")
+        log.error("Error registering MCP tools: %s", e)
         return False
 
+def _load_agent_definition(path: str = AGENT_DEFINITION_FILE, cache_path: str = AGENT_DEFINITION_CACHE_FILE):
+    """
+    Load the agent definition YAML, reusing a JSON copy while the YAML is unchanged.
+    
+    The JSON copy records the YAML's mtime and size; when either differs the
+    YAML is parsed again and the copy rewritten.
+    """
+    stat = os.stat(path)
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = json.loads(f.read())
+        if cached.get("stamp") == stamp:
+            return cached["definition"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    
+    # PyYAML is only imported when the JSON copy is stale
+    import yaml
+    # Use the libyaml-backed loader when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    # Binary mode: the YAML reader detects the encoding itself, and libyaml reads bytes directly
+    with open(path, 'rb') as f:
+        agent_def = yaml.load(f, Loader=SafeLoader)
+    try:
+        with open(cache_path, 'w') as f:
+            json.dump({"stamp": stamp, "definition": agent_def}, f)
+    except (OSError, TypeError) as e:
+        log.debug("Could not cache agent definition: %s", e)
+    return agent_def
+
 def validate_agent_definition():
     """Validate the agent definition file."""
     try:
         if not os.path.exists(AGENT_DEFINITION_FILE):
-            log.error(f"Agent definition file not found: {AGENT_DEFINITION_FILE}")
+            log.error("Agent definition file not found: %s", AGENT_DEFINITION_FILE)
             return False
         
-        with open(AGENT_DEFINITION_FILE, 'r') as f:
-            agent_def = yaml.safe_load(f)
+        agent_def = _load_agent_definition()
         
-        required_fields = ['name', 'description', 'tools', 'instructions', 'model']
-        for field in required_fields:
-            if field not in agent_def:
-                log.error(f"Missing required field in agent definition: {field}")
-                return False
+        missing = REQUIRED_AGENT_FIELDS.difference(agent_def)
+        if missing:
+            log.error("Missing required fields in agent definition: %s", ", ".join(sorted(missing)))
+            return False
         
         log.info("Agent definition is valid")
         return True
     except Exception as e:
-        log.error(f"Error validating agent definition: {str(e)}")
+        log.error("Error validating agent definition: %s", e)
         return False
 
+@functools.cache
+def _orchestrate_available() -> bool:
+    """Whether the orchestrate CLI is on PATH; looked up once per process without running it."""
+    return shutil.which('orchestrate') is not None
+
 def publish_agent():
     """Publish the agent to watsonx.orchestrate."""
     try:
         # Check if orchestrate CLI is available
-        try:
-            subprocess.run(['orchestrate', '--version'], check=True, capture_output=True)
-            log.info("orchestrate CLI is available")
-        except (subprocess.SubprocessError, FileNotFoundError):
+        if not _orchestrate_available():
             log.error("orchestrate CLI not found. Make sure it's installed and in your PATH")
             return False
+        log.info("orchestrate CLI is available")
         
         # For demonstration purposes, we'll mock the agent publication
-        log.info(f"Mocking publication of agent: {AGENT_NAME}")
+        log.info("Mocking publication of agent: %s", AGENT_NAME)
         
         # In a real scenario, we would run the actual command:
         # result = subprocess.run(
@@ -85,13 +124,13 @@ def publish_agent():
         # )
         
         # Mock successful publication
-        log.info(f"Agent published successfully with ID: mock-agent-id-12345")
+        log.info("Agent published successfully with ID: mock-agent-id-12345")
         return True
     except subprocess.CalledProcessError as e:
-        log.error(f"Error publishing agent: {e.stderr.strip() if e.stderr else str(e)}")
+        log.error("Error publishing agent: %s", e.stderr.strip() if e.stderr else e)
         return False
     except Exception as e:
-        log.error(f"Error publishing agent: {str(e)}")
+        log.error("Error publishing agent: %s", e)
         return False
 
 def main():
@@ -110,7 +149,7 @@ def main():
     if not publish_agent():
         return False
     
-    log.info(f"Successfully published {AGENT_NAME} agent to watsonx.orchestrate")
+    log.info("Successfully published %s agent to watsonx.orchestrate", AGENT_NAME)
     return True
 
 if __name__ == "__main__":
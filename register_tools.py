@@ -39,7 +39,7 @@ def main():
             log.error("Failed to register MCP tools")
             return False
     except Exception as e:
-        log.error(f"Error registering MCP tools: {str(e)}")
+        log.error("Error registering MCP tools: %s", e)
         return False
 
 if __name__ == "__main__":
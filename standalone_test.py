@@ -10,8 +10,19 @@ This script tests the GitHub Issues Analyzer functionality with mock data.
 import os
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 
+# Optional: orjson for faster result serialisation
+try:
+    import orjson
+    
+    def _dump_json(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_json(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,21 +34,34 @@ log = logging.getLogger(__name__)
 # Constants
 TEST_OUTPUT_DIR = "test_output"
 
+# Sample issues shared by every mock analyzer; built once and never modified
+MOCK_ISSUES = {
+    'Issue Number': [1, 2, 3],
+    'Title': ['Issue 1', 'Issue 2', 'Issue 3'],
+    'State': ['open', 'closed', 'open'],
+    'Created Date': ['2025-01-01', '2025-01-02', '2025-01-03'],
+    'Closed Date': [None, '2025-01-05', None],
+    'Labels': ['bug', 'enhancement', 'bug, documentation'],
+    'Comments': ['Comment 1', 'Comment 2', 'Comment 3']
+}
+
 def ensure_output_dir():
     """Ensure the test output directory exists."""
-    if not os.path.exists(TEST_OUTPUT_DIR):
-        os.makedirs(TEST_OUTPUT_DIR)
-        log.info(f"Created output directory: {TEST_OUTPUT_DIR}")
+    os.makedirs(TEST_OUTPUT_DIR, exist_ok=True)
 
 def save_test_result(name: str, data: Any):
-    """Save test result to a JSON file."""
-    ensure_output_dir()
+    """Save test result to a JSON file (run_all_tests creates the output directory)."""
     output_path = os.path.join(TEST_OUTPUT_DIR, f"{name}.json")
     
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        remaining = memoryview(_dump_json(data))
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+    finally:
+        os.close(fd)
     
-    log.info(f"Saved test result to {output_path}")
+    log.info("Saved test result to %s", output_path)
 
 class MockGitHubIssuesAnalyzer:
     """Mock class for testing."""
@@ -46,20 +70,10 @@ class MockGitHubIssuesAnalyzer:
         self.repo = repo
         self.token = token
         self.output_file = output_file
-        self.issues_df = None
+        self.issues_df = MOCK_ISSUES
         
     def fetch_issues(self, include_comments=True):
         """Mock fetch_issues method."""
-        # Create a sample DataFrame-like structure
-        self.issues_df = {
-            'Issue Number': [1, 2, 3],
-            'Title': ['Issue 1', 'Issue 2', 'Issue 3'],
-            'State': ['open', 'closed', 'open'],
-            'Created Date': ['2025-01-01', '2025-01-02', '2025-01-03'],
-            'Closed Date': [None, '2025-01-05', None],
-            'Labels': ['bug', 'enhancement', 'bug, documentation'],
-            'Comments': ['Comment 1', 'Comment 2', 'Comment 3']
-        }
         return self.issues_df
         
     def summarize_issues(self, by_product=False, by_tag=False, time_period=None):
@@ -139,7 +153,7 @@ def test_summarize_issues():
         log.info("summarize_issues tests completed successfully")
         return True
     except Exception as e:
-        log.error(f"Error testing summarize_issues: {str(e)}")
+        log.error("Error testing summarize_issues: %s", e)
         return False
 
 def test_analyze_metrics():
@@ -156,7 +170,7 @@ def test_analyze_metrics():
         log.info("analyze_metrics test completed successfully")
         return True
     except Exception as e:
-        log.error(f"Error testing analyze_metrics: {str(e)}")
+        log.error("Error testing analyze_metrics: %s", e)
         return False
 
 def test_detect_similar_issues():
@@ -177,7 +191,7 @@ def test_detect_similar_issues():
         log.info("detect_similar_issues tests completed successfully")
         return True
     except Exception as e:
-        log.error(f"Error testing detect_similar_issues: {str(e)}")
+        log.error("Error testing detect_similar_issues: %s", e)
         return False
 
 def test_suggest_tags():
@@ -198,7 +212,7 @@ def test_suggest_tags():
         log.info("suggest_tags tests completed successfully")
         return True
     except Exception as e:
-        log.error(f"Error testing suggest_tags: {str(e)}")
+        log.error("Error testing suggest_tags: %s", e)
         return False
 
 def test_csm_intelligence():
@@ -218,30 +232,93 @@ def test_csm_intelligence():
         log.info("csm_intelligence test completed successfully")
         return True
     except Exception as e:
-        log.error(f"Error testing csm_intelligence: {str(e)}")
+        log.error("Error testing csm_intelligence: %s", e)
+        return False
+
+def _paginated_comments(total: int, advertise_last: bool):
+    """Return an httpx handler serving total mock comments 100 per page, with GitHub-style Link headers."""
+    import httpx
+    
+    def handler(request):
+        page = int(request.url.params.get("page", "1"))
+        per_page = int(request.url.params.get("per_page", "30"))
+        last = max(1, -(-total // per_page))
+        body = [{"id": i} for i in range((page - 1) * per_page, min(page * per_page, total))]
+        links = []
+        if page < last:
+            links.append(f'<{request.url.copy_merge_params({"page": page + 1})}>; rel="next"')
+            if advertise_last:
+                links.append(f'<{request.url.copy_merge_params({"page": last})}>; rel="last"')
+        return httpx.Response(200, json=body, headers={"Link": ", ".join(links)})
+    
+    return handler
+
+def test_rest_pagination():
+    """Test that REST pagination follows Link headers to every page exactly once."""
+    log.info("Testing REST pagination...")
+    
+    try:
+        import asyncio
+        import httpx
+        import gh_issues_tool
+        if not gh_issues_tool.OPTIONAL_DEPS_AVAILABLE:
+            raise ImportError("gh_issues_tool optional dependencies are missing")
+    except ImportError as e:
+        log.info("Skipping REST pagination test: %s", e)
+        return None
+    
+    async def walk(advertise_last: bool):
+        transport = httpx.MockTransport(_paginated_comments(250, advertise_last))
+        async with httpx.AsyncClient(transport=transport) as session:
+            return await gh_issues_tool.gh_paginate_async(
+                "https://api.example.com/repos/org/repo/issues/1/comments",
+                headers={}, params={"per_page": 100}, session=session
+            )
+    
+    try:
+        # rel="last" fans pages 2..last out concurrently; rel="next" alone walks them serially
+        result = {}
+        for name, advertise_last in (("fan_out", True), ("serial", False)):
+            ids = [item["id"] for item in asyncio.run(walk(advertise_last))]
+            assert ids == list(range(250)), f"{name} walk returned {len(ids)} items out of order or repeated"
+            result[name] = len(ids)
+        save_test_result("rest_pagination", result)
+        
+        log.info("REST pagination test completed successfully")
+        return True
+    except Exception as e:
+        log.error("Error testing REST pagination: %s", e)
         return False
 
 def run_all_tests():
     """Run all tests and report results."""
     log.info("Starting GitHub Issues Analyzer tests...")
+    ensure_output_dir()
     
-    test_results = {
-        "summarize_issues": test_summarize_issues(),
-        "analyze_metrics": test_analyze_metrics(),
-        "detect_similar_issues": test_detect_similar_issues(),
-        "suggest_tags": test_suggest_tags(),
-        "csm_intelligence": test_csm_intelligence()
+    tests = {
+        "summarize_issues": test_summarize_issues,
+        "analyze_metrics": test_analyze_metrics,
+        "detect_similar_issues": test_detect_similar_issues,
+        "suggest_tags": test_suggest_tags,
+        "csm_intelligence": test_csm_intelligence,
+        "rest_pagination": test_rest_pagination
     }
     
+    # The tests are independent and write separate files, so run them side by side
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {name: executor.submit(test) for name, test in tests.items()}
+        test_results = {name: future.result() for name, future in futures.items()}
+    
     # Report overall results
+    # A result of None marks a test skipped for missing optional dependencies
     success_count = sum(1 for result in test_results.values() if result)
-    total_count = len(test_results)
+    total_count = sum(1 for result in test_results.values() if result is not None)
     
-    log.info(f"Test summary: {success_count}/{total_count} tests passed")
+    log.info("Test summary: %d/%d tests passed", success_count, total_count)
     
     for test_name, result in test_results.items():
-        status = "PASSED" if result else "FAILED"
-        log.info(f"  {test_name}: {status}")
+        status = "SKIPPED" if result is None else "PASSED" if result else "FAILED"
+        log.info("  %s: %s", test_name, status)
     
     return test_results
 
@@ -8,9 +8,41 @@ This script tests the GitHub Issues Analyzer with sample data.
 """
 
 import os
+import sys
 import json
+import time
 import logging
-from typing import Dict, Any, List, Optional
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
+
+# Optional: orjson for faster result serialisation (also handles numpy scalars and arrays)
+try:
+    import orjson
+    
+    def _dump_json(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+    
+    _load_json = orjson.loads
+except ImportError:
+    def _dump_json(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+    
+    _load_json = json.loads
+
+# Optional: zstandard for compressed result files (see TEST_OUTPUT_ZSTD below)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Optional: msgpack for the local issue cache (binary, smaller and quicker to load than JSON)
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
 
 # Set up logging
 logging.basicConfig(
@@ -22,163 +54,172 @@ log = logging.getLogger(__name__)
 
 # Try to import the analyzer class
 try:
-    from github_issues_agent import GitHubIssuesAnalyzer
+    from github_issues_agent import GitHubIssuesAnalyzer, SKLEARN_AVAILABLE
+    from gh_issues_tool import fetch_issue_rows
 except ImportError:
     log.error("github_issues_agent.py must be in the same directory or in the Python path")
-    import sys
     sys.exit(1)
 
 # Constants
 DEFAULT_GITHUB_TOKEN = os.getenv("GH_TOKEN")
 DEFAULT_REPO = os.getenv("GH_REPO", "kwright15/github-issues-tool")
 TEST_OUTPUT_DIR = "test_output"
+MAX_TEST_WORKERS = 5
+# Fetched issue rows are reused from here for an hour, so repeated local runs skip GitHub
+ISSUES_CACHE_PATH = os.path.join(TEST_OUTPUT_DIR, ".issues_cache.mp" if MSGPACK_AVAILABLE else ".issues_cache.json")
+ISSUES_CACHE_MAX_AGE_SECONDS = 3600
+# Set TEST_OUTPUT_ZSTD=1 to write results as .json.zst (e.g. for CI artifacts); plain JSON otherwise
+TEST_OUTPUT_ZSTD = os.getenv("TEST_OUTPUT_ZSTD") == "1"
+if TEST_OUTPUT_ZSTD and not ZSTD_AVAILABLE:
+    log.warning("TEST_OUTPUT_ZSTD is set but zstandard is not installed; writing plain JSON")
+    TEST_OUTPUT_ZSTD = False
+ZSTD_LEVEL = 3
+# Bound once for save_test_result, which runs for every case
+_JOIN = os.path.join
+
+_output_dir_ready = False
 
 def ensure_output_dir():
-    """Ensure the test output directory exists."""
-    if not os.path.exists(TEST_OUTPUT_DIR):
-        os.makedirs(TEST_OUTPUT_DIR)
-        log.info(f"Created output directory: {TEST_OUTPUT_DIR}")
+    """Ensure the test output directory exists; only the first call touches the filesystem."""
+    global _output_dir_ready
+    if _output_dir_ready:
+        return
+    os.makedirs(TEST_OUTPUT_DIR, exist_ok=True)
+    _output_dir_ready = True
 
 def save_test_result(name: str, data: Any):
     """Save test result to a JSON file."""
     ensure_output_dir()
-    output_path = os.path.join(TEST_OUTPUT_DIR, f"{name}.json")
+    output_path = _JOIN(TEST_OUTPUT_DIR, name + ".json")
+    payload = _dump_json(data)
+    if TEST_OUTPUT_ZSTD:
+        output_path += ".zst"
+        # A compressor must not be shared between threads, and the tests save concurrently
+        payload = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1).compress(payload)
     
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        remaining = memoryview(payload)
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+    finally:
+        os.close(fd)
     
-    log.info(f"Saved test result to {output_path}")
-
-def test_summarize_issues():
-    """Test the summarize_issues functionality."""
-    log.info("Testing summarize_issues...")
+    log.info("Saved test result to %s", output_path)
+
+# Test cases: (result name, analyzer method, keyword arguments)
+CASES: List[Tuple[str, str, Dict[str, Any]]] = [
+    ("summarize_issues_default", "summarize_issues", {}),
+    ("summarize_issues_by_tag", "summarize_issues", {"by_tag": True}),
+    ("summarize_issues_time_period", "summarize_issues", {"time_period": "1m"}),
+    ("analyze_metrics", "analyze_metrics", {}),
+    ("detect_similar_issues_default", "detect_similar_issues", {}),
+    ("detect_similar_issues_lower", "detect_similar_issues", {"threshold": 0.5}),
+    ("suggest_tags_all", "suggest_tags", {}),
+    # This assumes there's at least one issue with number 1
+    ("suggest_tags_specific", "suggest_tags", {"issue_number": 1}),
+    ("csm_intelligence", "csm_intelligence", {
+        "issue_title": "Problem with API authentication",
+        "issue_body": "I'm having trouble authenticating with the API. Getting 401 errors."
+    }),
+]
+
+def run_case(analyzer: GitHubIssuesAnalyzer, name: str, method: str, kwargs: Dict[str, Any]) -> Tuple[bool, float]:
+    """Call one analyzer method and save its result under name; return (succeeded, seconds taken)."""
+    log.info("Testing %s...", name)
+    started = time.perf_counter()
     
     try:
-        analyzer = GitHubIssuesAnalyzer(repo=DEFAULT_REPO, token=DEFAULT_GITHUB_TOKEN)
-        
-        # Test with default parameters
-        result_default = analyzer.summarize_issues()
-        save_test_result("summarize_issues_default", result_default)
-        
-        # Test with by_tag=True
-        result_by_tag = analyzer.summarize_issues(by_tag=True)
-        save_test_result("summarize_issues_by_tag", result_by_tag)
-        
-        # Test with time_period="1m"
-        result_time_period = analyzer.summarize_issues(time_period="1m")
-        save_test_result("summarize_issues_time_period", result_time_period)
-        
-        log.info("summarize_issues tests completed successfully")
-        return True
+        save_test_result(name, getattr(analyzer, method)(**kwargs))
+        log.info("%s test completed successfully", name)
+        ok = True
     except Exception as e:
-        log.error(f"Error testing summarize_issues: {str(e)}")
-        return False
-
-def test_analyze_metrics():
-    """Test the analyze_metrics functionality."""
-    log.info("Testing analyze_metrics...")
+        log.error("Error testing %s: %s", name, e)
+        ok = False
+    return ok, time.perf_counter() - started
+
+def _pack_cache(data: Any) -> bytes:
+    """Encode the issue cache: msgpack when installed, JSON otherwise."""
+    if MSGPACK_AVAILABLE:
+        return msgpack.packb(data, use_bin_type=True)
+    return _dump_json(data)
+
+def _unpack_cache(payload: bytes) -> Any:
+    """Decode an issue cache written by _pack_cache."""
+    if MSGPACK_AVAILABLE:
+        return msgpack.unpackb(payload, raw=False)
+    return _load_json(payload)
+
+def load_analyzer(refresh: bool = False) -> GitHubIssuesAnalyzer:
+    """
+    Return an analyzer with the test repository's issues loaded.
     
-    try:
-        analyzer = GitHubIssuesAnalyzer(repo=DEFAULT_REPO, token=DEFAULT_GITHUB_TOKEN)
-        
-        # Test metrics analysis
-        result = analyzer.analyze_metrics()
-        save_test_result("analyze_metrics", result)
-        
-        log.info("analyze_metrics test completed successfully")
-        return True
-    except Exception as e:
-        log.error(f"Error testing analyze_metrics: {str(e)}")
-        return False
-
-def test_detect_similar_issues():
-    """Test the detect_similar_issues functionality."""
-    log.info("Testing detect_similar_issues...")
+    Issue rows cached by a run within the last ISSUES_CACHE_MAX_AGE_SECONDS are
+    reused unless refresh is set; otherwise they are fetched and the cache rewritten.
+    """
+    if (not refresh and os.path.exists(ISSUES_CACHE_PATH)
+            and os.path.getmtime(ISSUES_CACHE_PATH) > time.time() - ISSUES_CACHE_MAX_AGE_SECONDS):
+        with open(ISSUES_CACHE_PATH, 'rb') as f:
+            cached = _unpack_cache(f.read())
+        if cached.get("repo") == DEFAULT_REPO:
+            log.info("Using cached issues from %s", ISSUES_CACHE_PATH)
+            return GitHubIssuesAnalyzer.from_issues(DEFAULT_REPO, cached["rows"], token=DEFAULT_GITHUB_TOKEN)
     
+    rows = fetch_issue_rows(repo=DEFAULT_REPO, token=DEFAULT_GITHUB_TOKEN)
+    # Write to a temporary file and swap it in, so an interrupted run never leaves a
+    # truncated cache behind; the fetched rows are used even if the write fails
+    tmp_path = ISSUES_CACHE_PATH + ".tmp"
     try:
-        analyzer = GitHubIssuesAnalyzer(repo=DEFAULT_REPO, token=DEFAULT_GITHUB_TOKEN)
-        
-        # Test with default threshold
-        result_default = analyzer.detect_similar_issues()
-        save_test_result("detect_similar_issues_default", result_default)
-        
-        # Test with lower threshold
-        result_lower = analyzer.detect_similar_issues(threshold=0.5)
-        save_test_result("detect_similar_issues_lower", result_lower)
-        
-        log.info("detect_similar_issues tests completed successfully")
-        return True
-    except Exception as e:
-        log.error(f"Error testing detect_similar_issues: {str(e)}")
-        return False
-
-def test_suggest_tags():
-    """Test the suggest_tags functionality."""
-    log.info("Testing suggest_tags...")
+        ensure_output_dir()
+        with open(tmp_path, 'wb') as f:
+            f.write(_pack_cache({"repo": DEFAULT_REPO, "rows": rows}))
+        os.replace(tmp_path, ISSUES_CACHE_PATH)
+    except OSError as e:
+        log.warning("Could not write issue cache %s: %s", ISSUES_CACHE_PATH, e)
+    return GitHubIssuesAnalyzer.from_issues(DEFAULT_REPO, rows, token=DEFAULT_GITHUB_TOKEN)
+
+def run_all_tests(refresh: bool = False):
+    """Run all tests and report results; refresh ignores the local issue cache."""
+    log.info("Starting GitHub Issues Analyzer tests...")
+    ensure_output_dir()
     
+    # Load the issues once; every case then reads the same analyzer
     try:
-        analyzer = GitHubIssuesAnalyzer(repo=DEFAULT_REPO, token=DEFAULT_GITHUB_TOKEN)
-        
-        # Test for all issues
-        result_all = analyzer.suggest_tags()
-        save_test_result("suggest_tags_all", result_all)
-        
-        # Test for a specific issue (if available)
-        # This assumes there's at least one issue with number 1
-        result_specific = analyzer.suggest_tags(issue_number=1)
-        save_test_result("suggest_tags_specific", result_specific)
-        
-        log.info("suggest_tags tests completed successfully")
-        return True
+        analyzer = load_analyzer(refresh)
+        # Build the shared per-issue features up front too, so their one-off cost is
+        # not charged to whichever summarize/detect case happens to run first
+        analyzer.title_words()
+        if SKLEARN_AVAILABLE:
+            analyzer.similarity_matrix()
+        max_workers = MAX_TEST_WORKERS
     except Exception as e:
-        log.error(f"Error testing suggest_tags: {str(e)}")
-        return False
-
-def test_csm_intelligence():
-    """Test the csm_intelligence functionality."""
-    log.info("Testing csm_intelligence...")
-    
-    try:
+        log.error("Error preparing analyzer: %s", e)
+        # Each case will try to fetch the issues itself; run them one at a time so
+        # they do not all hit the API at once
         analyzer = GitHubIssuesAnalyzer(repo=DEFAULT_REPO, token=DEFAULT_GITHUB_TOKEN)
-        
-        # Test with sample issue data
-        result = analyzer.csm_intelligence(
-            issue_title="Problem with API authentication",
-            issue_body="I'm having trouble authenticating with the API. Getting 401 errors."
-        )
-        save_test_result("csm_intelligence", result)
-        
-        log.info("csm_intelligence test completed successfully")
-        return True
-    except Exception as e:
-        log.error(f"Error testing csm_intelligence: {str(e)}")
-        return False
-
-def run_all_tests():
-    """Run all tests and report results."""
-    log.info("Starting GitHub Issues Analyzer tests...")
+        max_workers = 1
     
-    test_results = {
-        "summarize_issues": test_summarize_issues(),
-        "analyze_metrics": test_analyze_metrics(),
-        "detect_similar_issues": test_detect_similar_issues(),
-        "suggest_tags": test_suggest_tags(),
-        "csm_intelligence": test_csm_intelligence()
-    }
+    # The cases only read the shared analyzer, so run them side by side
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_case, analyzer, *case) for case in CASES]
+        # Parallel lists, one entry per case in CASES order
+        names = [case[0] for case in CASES]
+        oks, elapsed = map(list, zip(*(future.result() for future in futures)))
     
     # Report overall results
-    success_count = sum(1 for result in test_results.values() if result)
-    total_count = len(test_results)
-    
-    log.info(f"Test summary: {success_count}/{total_count} tests passed")
+    log.info("Test summary: %d/%d tests passed", sum(oks), len(names))
     
-    for test_name, result in test_results.items():
-        status = "PASSED" if result else "FAILED"
-        log.info(f"  {test_name}: {status}")
+    for test_name, ok, seconds in zip(names, oks, elapsed):
+        status = "PASSED" if ok else "FAILED"
+        log.info("  %s: %s (%.2fs)", test_name, status, seconds)
     
-    return test_results
+    return dict(zip(names, oks))
 
 if __name__ == "__main__":
-    run_all_tests()
+    parser = argparse.ArgumentParser(description="Run the GitHub Issues Analyzer tests against a live repository.")
+    parser.add_argument("--refresh", action="store_true", help="Fetch issues from GitHub even if a recent local cache exists")
+    args = parser.parse_args()
+    results = run_all_tests(refresh=args.refresh)
+    sys.exit(0 if all(results.values()) else 1)
 
 # Made with Bob